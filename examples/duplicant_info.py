@@ -17,7 +17,7 @@ from oni_save_parser.extractors import (
     extract_duplicant_traits,
     extract_health_status,
 )
-from oni_save_parser.formatters import format_duplicant_compact
+from oni_save_parser.formatters import format_duplicants_compact
 
 
 def extract_duplicant_info(dup_object: Any) -> dict[str, Any]:
@@ -104,8 +104,9 @@ def main() -> int:
 
         elif args.format == "compact":
             print(f"Found {len(duplicants)} duplicants\n")
-            for info in dup_info_list:
-                print(format_duplicant_compact(info))
+            formatted = format_duplicants_compact(dup_info_list)
+            for info, text in zip(dup_info_list, formatted, strict=True):
+                print(text)
 
                 # Show behaviors in debug mode
                 if args.debug:
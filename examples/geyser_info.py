@@ -36,7 +36,7 @@ from typing import Any
 from oni_save_parser import get_game_objects_by_prefab, list_prefab_types, load_save_file
 from oni_save_parser.element_loader import get_global_element_loader
 from oni_save_parser.extractors import extract_geyser_stats, get_geyser_config_from_prefab
-from oni_save_parser.formatters import format_geyser_compact, format_geyser_detailed
+from oni_save_parser.formatters import format_geyser_compact, write_geyser_detailed
 
 
 def find_geyser_prefabs(save_file_path: Path) -> list[str]:
@@ -321,7 +321,8 @@ def main() -> int:
                                 "thermal_per_eruption_kdtu": stats["thermal_per_eruption_kdtu"],
                             }
 
-                        output = format_geyser_detailed(
+                        write_geyser_detailed(
+                            sys.stdout,
                             prefab_name=prefab_name,
                             index=i,
                             position=position,
@@ -333,7 +334,7 @@ def main() -> int:
                             element_max_mass=element_max_mass,
                             analyzed=analyzed,
                         )
-                        print(output)
+                        sys.stdout.write("\n")
 
                     # Show debug info if requested
                     if args.debug:
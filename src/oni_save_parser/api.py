@@ -3,6 +3,7 @@
 This module provides simple functions for loading and saving ONI save files.
 """
 
+from collections.abc import Collection
 from pathlib import Path
 from typing import Any
 
@@ -10,7 +11,10 @@ from oni_save_parser.save_structure import SaveGame, parse_save_game, unparse_sa
 
 
 def load_save_file(
-    file_path: str | Path, verify_version: bool = True, allow_minor_mismatch: bool = True
+    file_path: str | Path,
+    verify_version: bool = True,
+    allow_minor_mismatch: bool = True,
+    lazy_prefabs: Collection[str] | None = None,
 ) -> SaveGame:
     """Load an ONI save file from disk.
 
@@ -18,6 +22,8 @@ def load_save_file(
         file_path: Path to the .sav file
         verify_version: Whether to verify save version compatibility
         allow_minor_mismatch: Allow different minor versions (default: True)
+        lazy_prefabs: Prefab names (e.g. {"Tile"}) whose objects are not parsed;
+            their groups have empty objects and are saved back unchanged
 
     Returns:
         Parsed SaveGame structure
@@ -42,6 +48,7 @@ def load_save_file(
         data,
         verify_version=verify_version,
         allow_minor_mismatch=allow_minor_mismatch,
+        lazy_prefabs=lazy_prefabs,
     )
 
 
@@ -155,4 +162,4 @@ def get_prefab_counts(save_game: SaveGame) -> dict[str, int]:
         >>> print(f"Duplicants: {counts.get('Minion', 0)}")
         >>> print(f"Doors: {counts.get('Door', 0)}")
     """
-    return {group.prefab_name: len(group.objects) for group in save_game.game_objects}
+    return {group.prefab_name: group.instance_count for group in save_game.game_objects}
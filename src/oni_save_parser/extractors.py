@@ -4,7 +4,7 @@ This module provides reusable functions to extract gameplay-relevant
 information from ONI save file game object behaviors.
 """
 
-import re
+import sys
 from typing import Any
 
 # Temperature range constants for data validation
@@ -12,6 +12,13 @@ from typing import Any
 MIN_GAME_TEMP_K = 200.0  # Below this is extremely cold (colder than liquid oxygen)
 MAX_GAME_TEMP_K = 4500.0  # Above this exceeds even tungsten volcano temps
 
+# Attribute experience cap by level (each level is 100 experience).
+# Duplicant attribute levels are small ints, so the common range is precomputed.
+_MAX_BY_LEVEL = tuple((i + 1) * 100.0 for i in range(64))
+
+# Health.State enum values: 0=Alive, 1=Incapacitated, 2=Dead
+_HEALTH_STATES = {0: "Alive", 1: "Incapacitated", 2: "Dead"}
+
 # Geyser configuration mapping: prefab_name -> (element_id, temperature_k)
 # Temperature values from ONI Wiki (converted to Kelvin: °C + 273.15)
 # Covers base game + Spaced Out DLC as of January 2025
@@ -49,6 +56,12 @@ GEYSER_CONFIG = {
     "OilWell": ("CrudeOil", 600.0),  # 326.85°C (Leaky Oil Fissure)
 }
 
+# Column-wise view of GEYSER_CONFIG used for lookups: prefab -> row index
+_PREFAB_INDEX = {prefab: i for i, prefab in enumerate(GEYSER_CONFIG)}
+_ELEMENT_IDS = tuple(element_id for element_id, _ in GEYSER_CONFIG.values())
+_TEMPERATURES_K = tuple(temperature_k for _, temperature_k in GEYSER_CONFIG.values())
+_UNKNOWN_GEYSER: tuple[None, None] = (None, None)
+
 
 def get_geyser_config_from_prefab(prefab_name: str) -> tuple[str | None, float | None]:
     """Get default element ID and temperature for a geyser prefab.
@@ -69,10 +82,50 @@ def get_geyser_config_from_prefab(prefab_name: str) -> tuple[str | None, float |
         get_geyser_config_from_prefab("UnknownGeyser")
         # Returns: (None, None)
     """
-    config = GEYSER_CONFIG.get(prefab_name)
-    if config:
-        return config
-    return (None, None)
+    # Cheap reject for the many non-geyser prefabs seen when scanning a save
+    if not prefab_name.startswith("GeyserGeneric_") and prefab_name != "OilWell":
+        return _UNKNOWN_GEYSER
+    i = _PREFAB_INDEX.get(prefab_name)
+    if i is None:
+        return _UNKNOWN_GEYSER
+    return (_ELEMENT_IDS[i], _TEMPERATURES_K[i])
+
+
+def _split_skill(skill_name: str) -> tuple[str, int] | None:
+    """Split a skill ID into base name and level (e.g., "Mining3" -> ("Mining", 3)).
+
+    Returns None if the name has no digit suffix or no base name.
+    """
+    base_name = skill_name.rstrip("0123456789")
+    if not base_name or len(base_name) == len(skill_name):
+        return None
+    return sys.intern(base_name), int(skill_name[len(base_name) :])
+
+
+def parse_mastery_list(mastery: list[Any]) -> dict[str, int]:
+    """Reduce a MasteryBySkillID list to the highest level per skill.
+
+    Args:
+        mastery: List of (skill_id, mastered) tuples, e.g. [('Mining1', True)]
+
+    Returns:
+        Dictionary mapping base skill name to highest mastered level:
+        {'Mining': 3, 'Building': 1}
+    """
+    # (base_name, level) for every mastered, well-formed entry
+    pairs = [
+        split
+        for skill_name, has_skill in (
+            item for item in mastery if isinstance(item, tuple) and len(item) == 2
+        )
+        if has_skill and (split := _split_skill(skill_name))
+    ]
+
+    # Keep highest level for each skill (in first-seen order)
+    mastery_by_skill: dict[str, int] = {}
+    for base_name, level in pairs:
+        mastery_by_skill[base_name] = max(mastery_by_skill.get(base_name, 0), level)
+    return mastery_by_skill
 
 
 def extract_duplicant_skills(minion_resume_behavior: Any) -> dict[str, Any]:
@@ -89,24 +142,16 @@ def extract_duplicant_skills(minion_resume_behavior: Any) -> dict[str, Any]:
             'current_role': str  # Current job role
         }
     """
-    template_data = minion_resume_behavior.template_data or {}
+    template_data = minion_resume_behavior.template_data
+    if not template_data:
+        return {"mastery_by_skill": {}, "aptitude_by_group": {}, "current_role": "None"}
 
     # MasteryBySkillID is a list of tuples like [('Mining1', True), ('Mining2', True)]
     # Convert to dict with skill levels extracted from number suffix
     mastery_raw = template_data.get("MasteryBySkillID", [])
     mastery_by_skill: dict[str, int] = {}
     if isinstance(mastery_raw, list):
-        for item in mastery_raw:
-            if isinstance(item, tuple) and len(item) == 2:
-                skill_name, has_skill = item
-                if has_skill:
-                    # Extract skill level from name (e.g., "Mining3" -> level 3)
-                    match = re.search(r"(\D+)(\d+)", skill_name)
-                    if match:
-                        base_name = match.group(1)
-                        level = int(match.group(2))
-                        # Keep highest level for each skill
-                        mastery_by_skill[base_name] = max(mastery_by_skill.get(base_name, 0), level)
+        mastery_by_skill = parse_mastery_list(mastery_raw)
     elif isinstance(mastery_raw, dict):
         mastery_by_skill = mastery_raw
 
@@ -126,7 +171,9 @@ def extract_duplicant_traits(traits_behavior: Any) -> list[str]:
     Returns:
         List of trait names: ['QuickLearner', 'Yokel', 'MouthBreather']
     """
-    template_data = traits_behavior.template_data or {}
+    template_data = traits_behavior.template_data
+    if not template_data:
+        return []
 
     # Try TraitIds first (used in actual save files)
     trait_ids: list[str] = template_data.get("TraitIds", [])
@@ -158,18 +205,36 @@ def extract_health_status(health_behavior: Any) -> dict[str, Any]:
             'can_be_incapacitated': bool
         }
     """
-    template_data = health_behavior.template_data or {}
+    template_data = health_behavior.template_data
+    if not template_data:
+        return {"state": "Alive", "can_be_incapacitated": True}
 
-    # State enum: 0=Alive, 1=Incapacitated, 2=Dead
-    state_map = {0: "Alive", 1: "Incapacitated", 2: "Dead"}
     state_value = template_data.get("State", 0)
 
     return {
-        "state": state_map.get(state_value, "Unknown"),
+        "state": _HEALTH_STATES.get(state_value, "Unknown"),
         "can_be_incapacitated": template_data.get("CanBeIncapacitated", True),
     }
 
 
+def _intern_key(key: Any) -> Any:
+    """Intern string keys that repeat across every duplicant (e.g., attribute IDs)."""
+    return sys.intern(key) if isinstance(key, str) else key
+
+
+def _attribute_level_entry(attr: dict[str, Any]) -> tuple[Any, dict[str, float]]:
+    """Build the (attribute ID, current/max) pair for a dict-form attribute level."""
+    # Handle lowercase field names (actual save file format)
+    attr_id = attr.get("attributeId") or attr.get("AttributeId", "Unknown")
+    # Calculate max from level (each level is 100 experience)
+    level = attr.get("level", 0)
+    if type(level) is int and 0 <= level < 64:
+        max_val = _MAX_BY_LEVEL[level]
+    else:
+        max_val = (level + 1) * 100.0 if level >= 0 else 100.0
+    return _intern_key(attr_id), {"current": attr.get("experience", 0.0), "max": max_val}
+
+
 def extract_attribute_levels(attribute_levels_behavior: Any) -> dict[str, dict[str, float]]:
     """Extract current attribute levels (health, stress, etc.).
 
@@ -184,30 +249,146 @@ def extract_attribute_levels(attribute_levels_behavior: Any) -> dict[str, dict[s
             ...
         }
     """
-    template_data = attribute_levels_behavior.template_data or {}
+    template_data = attribute_levels_behavior.template_data
+    if not template_data:
+        return {}
     save_load_levels = template_data.get("saveLoadLevels", [])
 
+    if all(isinstance(attr, dict) for attr in save_load_levels):
+        # Fast path for the actual save file format
+        return dict(map(_attribute_level_entry, save_load_levels))
+
     attributes = {}
     for attr in save_load_levels:
         if hasattr(attr, "AttributeId"):
-            attr_id = attr.AttributeId
-            current = getattr(attr, "experience", 0.0)
-            max_val = getattr(attr, "experienceMax", 100.0)
+            attributes[_intern_key(attr.AttributeId)] = {
+                "current": getattr(attr, "experience", 0.0),
+                "max": getattr(attr, "experienceMax", 100.0),
+            }
         elif isinstance(attr, dict):
-            # Handle lowercase field names (actual save file format)
-            attr_id = attr.get("attributeId") or attr.get("AttributeId", "Unknown")
-            current = attr.get("experience", 0.0)
-            # Calculate max from level (each level is 100 experience)
-            level = attr.get("level", 0)
-            max_val = (level + 1) * 100.0 if level >= 0 else 100.0
-        else:
-            continue
-
-        attributes[attr_id] = {"current": current, "max": max_val}
+            attr_id, entry = _attribute_level_entry(attr)
+            attributes[attr_id] = entry
 
     return attributes
 
 
+# extract_geyser_stats keys, in _geyser_stats_row order (thermal keys last)
+_GEYSER_STAT_KEYS = (
+    # Rates
+    "emission_rate_kg_s",
+    "average_output_active_kg_s",
+    "average_output_lifetime_kg_s",
+    # Eruption cycle
+    "eruption_duration_s",
+    "idle_duration_s",
+    "eruption_cycle_s",
+    "eruption_uptime_percent",
+    # Dormancy cycle
+    "active_duration_s",
+    "dormant_duration_s",
+    "dormancy_cycle_s",
+    "active_uptime_percent",
+    # Overall
+    "overall_uptime_percent",
+    # Production amounts
+    "kg_per_eruption",
+    "kg_per_eruption_cycle",
+    "kg_per_active_period",
+    # Storage requirements
+    "storage_for_idle_kg",
+    "storage_for_dormancy_kg",
+    "recommended_storage_kg",
+    # Thermal output
+    "peak_thermal_power_kdtu_s",
+    "average_thermal_power_kdtu_s",
+    "thermal_per_eruption_kdtu",
+)
+
+
+def _geyser_stats_row(
+    config: dict[str, Any],
+    element_data: dict[str, Any] | None,
+    temperature_k: float | None,
+) -> tuple[Any, ...]:
+    """Compute all geyser statistics in one pass, in _GEYSER_STAT_KEYS order."""
+    # Extract raw values (all five are present in real save files)
+    try:
+        scaled_rate = config["scaledRate"]
+        iteration_length = config["scaledIterationLength"]
+        iteration_percent = config["scaledIterationPercent"]
+        year_length = config["scaledYearLength"]
+        year_percent = config["scaledYearPercent"]
+    except KeyError:
+        scaled_rate = config.get("scaledRate", 0.0)
+        iteration_length = config.get("scaledIterationLength", 0.0)
+        iteration_percent = config.get("scaledIterationPercent", 0.0)
+        year_length = config.get("scaledYearLength", 0.0)
+        year_percent = config.get("scaledYearPercent", 0.0)
+
+    # scaledRate is in g/s in save files, convert to kg/s
+    emission_rate = scaled_rate / 1000.0
+
+    # Calculate rates
+    avg_active = emission_rate * iteration_percent
+    avg_lifetime = emission_rate * iteration_percent * year_percent
+
+    # Calculate durations
+    eruption_duration = iteration_length * iteration_percent
+    idle_duration = iteration_length * (1 - iteration_percent)
+    active_duration = year_length * year_percent
+    dormant_duration = year_length * (1 - year_percent)
+
+    # Calculate percentages
+    eruption_uptime_percent = iteration_percent * 100
+    active_uptime_percent = year_percent * 100
+    overall_uptime_percent = iteration_percent * year_percent * 100
+
+    # Calculate production amounts
+    kg_per_eruption = emission_rate * eruption_duration
+    kg_per_eruption_cycle = avg_active * iteration_length
+    kg_per_active_period = avg_active * active_duration
+
+    # Calculate storage requirements
+    storage_idle = avg_active * idle_duration
+    storage_dormancy = avg_lifetime * dormant_duration
+    recommended_storage = max(storage_idle, storage_dormancy)
+
+    # Add thermal calculations if data available
+    peak_thermal = avg_thermal = thermal_per_eruption = None
+    if element_data and temperature_k:
+        shc = element_data.get("specific_heat_capacity")
+        if shc:
+            # DTU = kg * SHC * temperature, convert to kDTU (multiply, not divide)
+            kdtu_per_kg = shc * temperature_k * 0.001
+            peak_thermal = emission_rate * kdtu_per_kg
+            avg_thermal = avg_lifetime * kdtu_per_kg
+            thermal_per_eruption = kg_per_eruption * kdtu_per_kg
+
+    return (
+        emission_rate,
+        avg_active,
+        avg_lifetime,
+        eruption_duration,
+        idle_duration,
+        iteration_length,
+        eruption_uptime_percent,
+        active_duration,
+        dormant_duration,
+        year_length,
+        active_uptime_percent,
+        overall_uptime_percent,
+        kg_per_eruption,
+        kg_per_eruption_cycle,
+        kg_per_active_period,
+        storage_idle,
+        storage_dormancy,
+        recommended_storage,
+        peak_thermal,
+        avg_thermal,
+        thermal_per_eruption,
+    )
+
+
 def extract_geyser_stats(
     config: dict[str, Any],
     element_data: dict[str, Any] | None = None,
@@ -254,13 +435,22 @@ def extract_geyser_stats(
             'recommended_storage_kg': float,       # Recommended storage capacity (kg)
         }
     """
-    # Extract raw values
+    # Extract raw values (all five are present in real save files)
+    try:
+        scaled_rate = config["scaledRate"]
+        iteration_length = config["scaledIterationLength"]
+        iteration_percent = config["scaledIterationPercent"]
+        year_length = config["scaledYearLength"]
+        year_percent = config["scaledYearPercent"]
+    except KeyError:
+        scaled_rate = config.get("scaledRate", 0.0)
+        iteration_length = config.get("scaledIterationLength", 0.0)
+        iteration_percent = config.get("scaledIterationPercent", 0.0)
+        year_length = config.get("scaledYearLength", 0.0)
+        year_percent = config.get("scaledYearPercent", 0.0)
+
     # scaledRate is in g/s in save files, convert to kg/s
-    emission_rate = config.get("scaledRate", 0.0) / 1000.0
-    iteration_length = config.get("scaledIterationLength", 0.0)
-    iteration_percent = config.get("scaledIterationPercent", 0.0)
-    year_length = config.get("scaledYearLength", 0.0)
-    year_percent = config.get("scaledYearPercent", 0.0)
+    emission_rate = scaled_rate / 1000.0
 
     # Calculate rates
     avg_active = emission_rate * iteration_percent
@@ -318,10 +508,11 @@ def extract_geyser_stats(
     if element_data and temperature_k:
         shc = element_data.get("specific_heat_capacity")
         if shc:
-            # DTU = kg * SHC * temperature, convert to kDTU by dividing by 1000
-            peak_thermal = emission_rate * shc * temperature_k / 1000
-            avg_thermal = avg_lifetime * shc * temperature_k / 1000
-            thermal_per_eruption = kg_per_eruption * shc * temperature_k / 1000
+            # DTU = kg * SHC * temperature, convert to kDTU (multiply, not divide)
+            kdtu_per_kg = shc * temperature_k * 0.001
+            peak_thermal = emission_rate * kdtu_per_kg
+            avg_thermal = avg_lifetime * kdtu_per_kg
+            thermal_per_eruption = kg_per_eruption * kdtu_per_kg
 
             result.update(
                 {
@@ -332,3 +523,41 @@ def extract_geyser_stats(
             )
 
     return result
+
+
+def extract_geyser_stats_batch(
+    configs: list[dict[str, Any]],
+    element_data: list[dict[str, Any] | None] | None = None,
+    temperatures_k: list[float | None] | None = None,
+) -> dict[str, list[Any]]:
+    """Extract geyser statistics for many geysers at once, column by column.
+
+    Computes the same values as extract_geyser_stats, but in column-oriented
+    form: each statistic is a list with one entry per config. Callers that
+    only need one or two columns (e.g., sorting by lifetime output) avoid
+    building a result dict per geyser.
+
+    Args:
+        configs: Geyser configuration dictionaries from behavior template_data
+        element_data: Optional element properties per geyser (for thermal columns)
+        temperatures_k: Optional output temperature per geyser in Kelvin
+
+    Returns:
+        Dictionary mapping each extract_geyser_stats key to a list of values,
+        in the same order as configs. Thermal columns are only included when
+        element_data is given, with None for geysers lacking thermal data.
+    """
+    if element_data is None:
+        rows = [_geyser_stats_row(config, None, None) for config in configs]
+        keys = _GEYSER_STAT_KEYS[:-3]  # Thermal fields are the last three
+    else:
+        temps = temperatures_k if temperatures_k is not None else [None] * len(configs)
+        rows = [
+            _geyser_stats_row(config, data, temp)
+            for config, data, temp in zip(configs, element_data, temps, strict=True)
+        ]
+        keys = _GEYSER_STAT_KEYS
+
+    # Transpose rows into columns; zip stops at len(keys), dropping unused thermal values
+    columns = zip(*rows, strict=True) if rows else ([] for _ in keys)
+    return {key: list(column) for key, column in zip(keys, columns, strict=False)}
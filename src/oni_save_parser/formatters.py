@@ -6,15 +6,122 @@ This module provides formatters for different output modes:
 - json: Machine-readable for automation
 """
 
+import functools
+import heapq
+import io
 import math
 import re
-from typing import Any
+from collections.abc import Callable, Iterable
+from operator import itemgetter
+from typing import Any, TextIO
 
 # ONI game constants
 ONI_CYCLE_DURATION_SECONDS = 600.0  # 1 cycle = 600 seconds
 GAS_RESERVOIR_CAPACITY_KG = 1000  # Gas Reservoir capacity
 LIQUID_RESERVOIR_CAPACITY_KG = 5000  # Liquid Reservoir capacity
 
+# One-line geyser summary used by format_geyser_compact and its batch variant
+_GEYSER_COMPACT_TEMPLATE = "%s #%d: %s avg @ (%s, %s) | %.0f%% erupting, %.0f%% active | %.1f°C %s"
+
+# Layout of format_geyser_detailed. Each section template ends with its own
+# trailing newline; _geyser_detailed_template joins the sections a geyser
+# needs and the result is filled from one context dict with %-formatting
+# (faster than str.format_map). Placeholder names are therefore unique across
+# templates, and comma-grouped numbers are preformatted into the dict.
+_GEYSER_HEADER_TEMPLATE = (
+    "=== %(name)s #%(number)s ===\n"
+    "Position:         (%(x)s, %(y)s)\n"
+    "Output Element:   %(element)s (%(state)s)\n"
+    "Output Temp:      %(temp_c).1f°C\n"
+    "Analyzed:         %(analyzed)s\n"
+    "\n"
+    "Output Rates:\n"
+    "  Average (lifetime):        %(lifetime_rate)12s  (accounts for all downtime)\n"
+    "  Average (when active):     %(active_rate)12s  (during active period only)\n"
+    "  Peak (when erupting):      %(peak_rate)12s  (maximum output rate)\n"
+    "\n"
+)
+_GEYSER_THERMAL_TEMPLATE = (
+    "Thermal Output:\n"
+    "  Peak thermal power:          %(peak_thermal)7.1f kDTU/s  (when erupting)\n"
+    "  Average thermal power:       %(avg_thermal)7.1f kDTU/s  (lifetime average)\n"
+    "  Total heat per eruption: %(thermal_eruption)11s kDTU    (over %(erupting_dur)s)\n"
+    "\n"
+)
+_GEYSER_ERUPTION_TEMPLATE = (
+    "Eruption Cycle (short-term):\n"
+    "  Erupting:    %(erupting_dur)20s  → Produces %(eruption_produces)s\n"
+    "  Idle:        %(idle_dur)20s  → Produces    0.0 kg\n"
+    "  Total cycle: %(cycle_dur)20s\n"
+    "  Uptime:      %(eruption_uptime)6.1f%%\n"
+    "\n"
+    "  Storage for idle period: %(storage_idle)s\n"
+)
+_GEYSER_IDLE_GAS_TEMPLATE = (
+    "    - %(idle_reservoirs)s Gas Reservoir%(idle_plural)s"
+    f" ({GAS_RESERVOIR_CAPACITY_KG:,} kg each)\n"
+)
+_GEYSER_DORMANCY_TEMPLATE = (
+    "\n"
+    "Dormancy Cycle (long-term):\n"
+    "  Active:      %(active_dur)28s  → Produces %(active_produces)s\n"
+    "  Dormant:     %(dormant_dur)28s  → Produces    0.0 kg\n"
+    "  Total cycle: %(dormancy_cycle_dur)28s\n"
+    "  Uptime:      %(active_uptime)6.1f%%\n"
+    "\n"
+    "  Storage for dormancy: %(storage_dormancy)s\n"
+)
+_GEYSER_DORMANT_GAS_TEMPLATE = (
+    "    - %(dormant_reservoirs)s Gas Reservoir%(dormant_plural)s"
+    f" ({GAS_RESERVOIR_CAPACITY_KG:,} kg each)\n"
+)
+_GEYSER_DORMANT_LIQUID_TEMPLATE = (
+    "    - %(dormant_reservoirs)s Liquid Reservoir%(dormant_plural)s"
+    f" ({LIQUID_RESERVOIR_CAPACITY_KG:,} kg each)\n"
+)
+_GEYSER_DORMANT_TILES_TEMPLATE = "    - %(tile_count)s tiles @ %(max_mass)s kg/tile max\n"
+_GEYSER_SUMMARY_TEMPLATE = (
+    "\n"
+    "Overall Uptime: %(overall_uptime).1f%% "
+    "(%(eruption_uptime).1f%% erupting × %(active_uptime).1f%% active)\n"
+    "\n"
+    "Recommended minimum storage: %(recommended)s (%(buffer_type)s buffer dominates)"
+)
+
+# Zero-width match at each lower-to-upper case boundary (acronyms stay intact)
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+# Sort key for (name, level) skill pairs
+_second = itemgetter(1)
+
+# Fields read by the compact duplicant formatter, fetched in one call
+_COMPACT_DUPLICANT_KEYS = itemgetter(
+    "name", "gender", "skills", "traits", "health", "stress", "position"
+)
+
+# Display names for traits that camelCase splitting would get wrong
+_TRAIT_OVERRIDES = {
+    "CantDig": "Can't Dig",
+    "CantBuild": "Can't Build",
+    "CantCook": "Can't Cook",
+    "CantResearch": "Can't Research",
+}
+
+# "GrantSkill_Mining2" / "Grant Skill_ Mining2" traits: prefix, then the skill
+# part, split into name and level in the same match when it has a level
+_GRANT_SKILL_RE = re.compile(
+    r"Grant ?Skill_(?P<part>\s*(?:(?P<skill>[A-Za-z]+)(?P<level>\d+))?.*)", re.DOTALL
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _space_camel(name: str) -> str:
+    """Convert camelCase to Title Case by inserting a space at case boundaries.
+
+    Trait names come from a small fixed vocabulary, so results are cached.
+    """
+    return _CAMEL_RE.sub(" ", name).strip()
+
 
 def format_duplicant_compact(duplicant_data: dict[str, Any]) -> str:
     """Format duplicant data in compact mode.
@@ -25,76 +132,111 @@ def format_duplicant_compact(duplicant_data: dict[str, Any]) -> str:
     Returns:
         Formatted string with essential duplicant info
     """
-    lines = []
+    return _format_duplicant_compact(duplicant_data, _space_camel)
+
+
+def format_duplicants_compact(duplicants: list[dict[str, Any]]) -> list[str]:
+    """Format many duplicants in compact mode.
+
+    Trait names of all duplicants are split from camelCase in a single regex
+    pass over a delimited concatenation, instead of once per trait.
+
+    Args:
+        duplicants: Dictionaries with duplicant information
+
+    Returns:
+        Formatted strings, one per duplicant, in the same order
+    """
+    names = list(dict.fromkeys(t for d in duplicants for t in d.get("traits") or ()))
+    spaced: dict[str, str] = {}
+    if names:
+        splits = _CAMEL_RE.sub(" ", "\x1f".join(names)).split("\x1f")
+        spaced = {name: split.strip() for name, split in zip(names, splits, strict=True)}
+    return [_format_duplicant_compact(d, spaced.__getitem__) for d in duplicants]
+
+
+def _format_duplicant_compact(
+    duplicant_data: dict[str, Any], space_camel: Callable[[str], str]
+) -> str:
+    """Format one duplicant, using space_camel to split plain trait names."""
+    # Callers normally fill in every key; fall back to defaults when some are missing
+    try:
+        name, gender, skills, traits, health, stress, position = _COMPACT_DUPLICANT_KEYS(
+            duplicant_data
+        )
+    except KeyError:
+        name = duplicant_data.get("name", "Unknown")
+        gender = duplicant_data.get("gender", "Unknown")
+        skills = duplicant_data.get("skills", {})
+        traits = duplicant_data.get("traits", [])
+        health = duplicant_data.get("health", {})
+        stress = duplicant_data.get("stress", {})
+        position = duplicant_data.get("position")
 
     # Header
-    name = duplicant_data.get("name", "Unknown")
-    lines.append(f"=== Duplicant: {name} ===")
+    header_line = f"=== Duplicant: {name} ==="
 
     # Gender
-    gender = duplicant_data.get("gender", "Unknown")
-    lines.append(f"Gender: {gender}")
+    gender_line = f"Gender: {gender}"
 
     # Skills (show top 3 non-zero skills)
-    skills = duplicant_data.get("skills", {})
-    skill_list = [(name, level) for name, level in skills.items() if level > 0]
-    skill_list.sort(key=lambda x: x[1], reverse=True)
-    if skill_list:
-        top_skills = skill_list[:3]
+    skills_line = ""
+    top_skills = heapq.nlargest(
+        3, ((name, level) for name, level in skills.items() if level > 0), key=_second
+    )
+    if top_skills:
         skill_str = ", ".join([f"{name} +{level}" for name, level in top_skills])
-        lines.append(f"Skills: {skill_str}")
+        skills_line = f"Skills: {skill_str}"
 
     # Traits
-    traits = duplicant_data.get("traits", [])
+    traits_line = ""
     if traits:
         formatted_traits = []
         for trait in traits:
             # Handle "Grant Skill_" traits specially
-            if trait.startswith("GrantSkill_") or trait.startswith("Grant Skill_"):
-                # Extract skill name after the prefix
-                skill_part = trait.replace("GrantSkill_", "").replace("Grant Skill_", "").strip()
-                # Split skill name and level (e.g., "Mining2" → "Mining 2")
-                match = re.match(r"([A-Za-z]+)(\d+)", skill_part)
-                if match:
-                    skill_name = match.group(1)
-                    skill_level = match.group(2)
-                    formatted_traits.append(f"Grants Skill: {skill_name} {skill_level}")
+            grant = _GRANT_SKILL_RE.match(trait)
+            if grant:
+                if grant["skill"]:
+                    # Split skill name and level (e.g., "Mining2" → "Mining 2")
+                    formatted_traits.append(f"Grants Skill: {grant['skill']} {grant['level']}")
                 else:
-                    formatted_traits.append(f"Grants Skill: {skill_part}")
-            # Apply manual overrides for known trait names
-            elif trait == "CantDig":
-                formatted_traits.append("Can't Dig")
-            elif trait == "CantBuild":
-                formatted_traits.append("Can't Build")
-            elif trait == "CantCook":
-                formatted_traits.append("Can't Cook")
-            elif trait == "CantResearch":
-                formatted_traits.append("Can't Research")
+                    formatted_traits.append(f"Grants Skill: {grant['part'].strip()}")
             else:
-                # Convert camelCase to Title Case: insert space before capitals
-                spaced = "".join([f" {c}" if c.isupper() else c for c in trait]).strip()
-                formatted_traits.append(spaced)
+                # Apply manual overrides for known trait names
+                override = _TRAIT_OVERRIDES.get(trait)
+                formatted_traits.append(override if override is not None else space_camel(trait))
 
         if formatted_traits:
             traits_str = ", ".join(formatted_traits)
-            lines.append(f"Traits: {traits_str}")
+            traits_line = f"Traits: {traits_str}"
 
     # Health and Stress
-    health = duplicant_data.get("health", {})
-    stress = duplicant_data.get("stress", {})
+    health_line = ""
     if health:
         health_current = int(health.get("current", 0))
         health_max = int(health.get("max", 100))
         stress_current = int(stress.get("current", 0))
-        stress_percent = int((stress_current / stress.get("max", 100)) * 100)
-        lines.append(f"Health: {health_current}/{health_max}  Stress: {stress_percent}%")
+        stress_max = stress.get("max", 100) or 100  # Guard against a zero max
+        stress_percent = int(stress_current * 100 // stress_max)
+        health_line = f"Health: {health_current}/{health_max}  Stress: {stress_percent}%"
 
     # Position
-    position = duplicant_data.get("position")
+    position_line = ""
     if position:
-        lines.append(f"Position: ({position[0]:.1f}, {position[1]:.1f})")
-
-    return "\n".join(lines)
+        position_line = f"Position: ({position[0]:.1f}, {position[1]:.1f})"
+
+    return "\n".join(
+        line
+        for line in (
+            header_line,
+            gender_line,
+            skills_line,
+            traits_line,
+            health_line,
+            position_line,
+        )
+        if line
+    )
 
 
 def format_geyser_compact(
@@ -118,18 +260,52 @@ def format_geyser_compact(
     Returns:
         Formatted one-line string
     """
-    avg_output = format_rate(stats["average_output_lifetime_kg_s"])
-    eruption_percent = stats["eruption_uptime_percent"]
-    active_percent = stats["active_uptime_percent"]
-
-    return (
-        f"{prefab_name} #{index + 1}: {avg_output} avg @ "
-        f"({position[0]}, {position[1]}) | "
-        f"{eruption_percent:.0f}% erupting, {active_percent:.0f}% active | "
-        f"{temperature_c:.1f}°C {element}"
+    return _GEYSER_COMPACT_TEMPLATE % (
+        prefab_name,
+        index + 1,
+        format_rate(stats["average_output_lifetime_kg_s"]),
+        position[0],
+        position[1],
+        stats["eruption_uptime_percent"],
+        stats["active_uptime_percent"],
+        temperature_c,
+        element,
     )
 
 
+def format_geyser_compact_batch(
+    rows: Iterable[tuple[str, int, tuple[float, float], str, float, dict[str, Any]]],
+) -> str:
+    """Format many geysers in compact mode, one line each.
+
+    Args:
+        rows: (prefab_name, index, position, element, temperature_c, stats)
+            tuples, as taken by format_geyser_compact
+
+    Returns:
+        Formatted lines joined with newlines
+    """
+    lines: list[str] = []
+    append = lines.append
+    for prefab_name, index, position, element, temperature_c, stats in rows:
+        append(
+            _GEYSER_COMPACT_TEMPLATE
+            % (
+                prefab_name,
+                index + 1,
+                format_rate(stats["average_output_lifetime_kg_s"]),
+                position[0],
+                position[1],
+                stats["eruption_uptime_percent"],
+                stats["active_uptime_percent"],
+                temperature_c,
+                element,
+            )
+        )
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=1024)
 def format_duration(seconds: float) -> str:
     """Format duration in seconds and cycles.
 
@@ -147,6 +323,7 @@ def format_duration(seconds: float) -> str:
         return f"{cycles:.1f} cycles ({seconds:,.1f}s)"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_mass(kg: float) -> str:
     """Format mass in kg or tons.
 
@@ -162,6 +339,14 @@ def format_mass(kg: float) -> str:
         return f"{kg:.1f} kg"
 
 
+@functools.lru_cache(maxsize=512)
+def _fmt_mass_padded(kg: float, width: int = 7) -> str:
+    """Format mass like format_mass, right-aligning the number to width."""
+    if kg >= 1000:
+        return f"{kg / 1000:>{width}.1f} t"
+    return f"{kg:>{width}.1f} kg"
+
+
 def format_rate(kg_s: float) -> str:
     """Format mass flow rate in g/s or kg/s.
 
@@ -206,147 +391,160 @@ def format_geyser_detailed(
     Returns:
         Formatted multi-line string
     """
-    lines = []
+    buf = io.StringIO()
+    write_geyser_detailed(
+        buf,
+        prefab_name,
+        index,
+        position,
+        element,
+        element_state,
+        temperature_c,
+        stats,
+        thermal_stats,
+        element_max_mass,
+        analyzed,
+    )
+    return buf.getvalue()
 
-    # Header
-    lines.append(f"=== {prefab_name} #{index + 1} ===")
-    lines.append(f"Position:         ({position[0]}, {position[1]})")
-    lines.append(f"Output Element:   {element} ({element_state})")
-    lines.append(f"Output Temp:      {temperature_c:.1f}°C")
-    lines.append(f"Analyzed:         {'Yes' if analyzed else 'No (estimated from prefab)'}")
-    lines.append("")
-
-    # Output Rates (use appropriate units: g/s for small, kg/s for large)
-    lines.append("Output Rates:")
-    lifetime_rate = format_rate(stats["average_output_lifetime_kg_s"])
-    active_rate = format_rate(stats["average_output_active_kg_s"])
-    peak_rate = format_rate(stats["emission_rate_kg_s"])
-    lines.append(f"  Average (lifetime):        {lifetime_rate:>12}  (accounts for all downtime)")
-    lines.append(f"  Average (when active):     {active_rate:>12}  (during active period only)")
-    lines.append(f"  Peak (when erupting):      {peak_rate:>12}  (maximum output rate)")
-    lines.append("")
 
-    # Thermal Output (if available)
-    if thermal_stats:
-        peak_thermal = thermal_stats.get("peak_thermal_power_kdtu_s", 0)
-        avg_thermal = thermal_stats.get("average_thermal_power_kdtu_s", 0)
-        thermal_eruption = thermal_stats.get("thermal_per_eruption_kdtu", 0)
-
-        lines.append("Thermal Output:")
-        lines.append(f"  Peak thermal power:          {peak_thermal:>7.1f} kDTU/s  (when erupting)")
-        lines.append(
-            f"  Average thermal power:       {avg_thermal:>7.1f} kDTU/s  (lifetime average)"
-        )
-        eruption_dur_str = format_duration(stats["eruption_duration_s"])
-        lines.append(
-            f"  Total heat per eruption: {thermal_eruption:>11,.1f} kDTU    "
-            f"(over {eruption_dur_str})"
-        )
-        lines.append("")
+def write_geyser_detailed(
+    out: TextIO,
+    prefab_name: str,
+    index: int,
+    position: tuple[float, float],
+    element: str,
+    element_state: str,
+    temperature_c: float,
+    stats: dict[str, Any],
+    thermal_stats: dict[str, Any] | None = None,
+    element_max_mass: float | None = None,
+    analyzed: bool = True,
+) -> None:
+    """Write geyser information in detailed multi-line format to a stream.
 
-    # Eruption Cycle
-    lines.append("Eruption Cycle (short-term):")
+    Same output as format_geyser_detailed, written section by section so
+    callers printing to a file or stdout skip building the whole string.
 
-    erupting_dur = format_duration(stats["eruption_duration_s"])
-    idle_dur = format_duration(stats["idle_duration_s"])
-    cycle_dur = format_duration(stats["eruption_cycle_s"])
+    Args:
+        out: Text stream to write to
+        prefab_name: Geyser type name
+        index: Geyser index (0-based)
+        position: (x, y) coordinates
+        element: Element type
+        element_state: "Gas" or "Liquid"
+        temperature_c: Output temperature in Celsius
+        stats: Statistics from extract_geyser_stats
+        thermal_stats: Optional thermal statistics
+        element_max_mass: Optional max kg per tile (for liquids)
+        analyzed: Whether geyser has been analyzed (default True)
+    """
+    # Stats read more than once below
+    eruption_cycle_s = stats["eruption_cycle_s"]
+    active_duration_s = stats["active_duration_s"]
+    storage_idle_kg = stats["storage_for_idle_kg"]
+    storage_dormancy_kg = stats["storage_for_dormancy_kg"]
+
+    # Values shared by the section templates (each duration formatted once)
+    ctx: dict[str, Any] = {
+        "name": prefab_name,
+        "number": index + 1,
+        "x": position[0],
+        "y": position[1],
+        "element": element,
+        "state": element_state,
+        "temp_c": temperature_c,
+        "analyzed": "Yes" if analyzed else "No (estimated from prefab)",
+        # Output Rates (use appropriate units: g/s for small, kg/s for large)
+        "lifetime_rate": format_rate(stats["average_output_lifetime_kg_s"]),
+        "active_rate": format_rate(stats["average_output_active_kg_s"]),
+        "peak_rate": format_rate(stats["emission_rate_kg_s"]),
+        # Eruption Cycle
+        "erupting_dur": format_duration(stats["eruption_duration_s"]),
+        "idle_dur": format_duration(stats["idle_duration_s"]),
+        "cycle_dur": format_duration(eruption_cycle_s),
+        "eruption_uptime": stats["eruption_uptime_percent"],
+        "storage_idle": format_mass(storage_idle_kg),
+        # Dormancy Cycle
+        "active_dur": format_duration(active_duration_s),
+        "dormant_dur": format_duration(stats["dormant_duration_s"]),
+        "dormancy_cycle_dur": format_duration(stats["dormancy_cycle_s"]),
+        "active_uptime": stats["active_uptime_percent"],
+        "storage_dormancy": format_mass(storage_dormancy_kg),
+        # Overall summary and recommended storage
+        "overall_uptime": stats["overall_uptime_percent"],
+        "recommended": format_mass(stats["recommended_storage_kg"]),
+        "buffer_type": "dormancy" if storage_dormancy_kg > storage_idle_kg else "idle",
+    }
+    is_gas = element_state == "Gas"
 
-    kg_eruption_raw = stats["kg_per_eruption"]
-    if kg_eruption_raw >= 1000:
-        kg_eruption_str = f"{kg_eruption_raw / 1000:>7.1f} t"
-    else:
-        kg_eruption_str = f"{kg_eruption_raw:>7.1f} kg"
+    # Thermal Output (if available)
+    thermal_eruption_kdtu = None
+    if thermal_stats:
+        thermal_eruption_kdtu = thermal_stats.get("thermal_per_eruption_kdtu")
+        ctx["peak_thermal"] = thermal_stats.get("peak_thermal_power_kdtu_s", 0)
+        ctx["avg_thermal"] = thermal_stats.get("average_thermal_power_kdtu_s", 0)
+        ctx["thermal_eruption"] = f"{thermal_eruption_kdtu or 0:,.1f}"
 
+    # Eruption Cycle
     thermal_eruption_str = ""
     if thermal_stats:
-        thermal_value = thermal_stats.get("thermal_per_eruption_kdtu", 0)
-        thermal_eruption_str = f" @ {thermal_value:>11,.0f} kDTU"
-
-    lines.append(
-        f"  Erupting:    {erupting_dur:>20}  → Produces {kg_eruption_str}{thermal_eruption_str}"
-    )
-    lines.append(f"  Idle:        {idle_dur:>20}  → Produces    0.0 kg")
-    lines.append(f"  Total cycle: {cycle_dur:>20}")
-    lines.append(f"  Uptime:      {stats['eruption_uptime_percent']:>6.1f}%")
-    lines.append("")
+        thermal_eruption_str = f" @ {thermal_eruption_kdtu or 0:>11,.0f} kDTU"
 
-    # Storage for idle
-    storage_idle = format_mass(stats["storage_for_idle_kg"])
-    lines.append(f"  Storage for idle period: {storage_idle}")
+    ctx["eruption_produces"] = _fmt_mass_padded(stats["kg_per_eruption"]) + thermal_eruption_str
 
     # Calculate reservoir count
-    if element_state == "Gas":
-        reservoir_count = math.ceil(stats["storage_for_idle_kg"] / GAS_RESERVOIR_CAPACITY_KG)
-        lines.append(
-            f"    - {reservoir_count} Gas Reservoir"
-            f"{'s' if reservoir_count != 1 else ''} (1,000 kg each)"
-        )
-
-    lines.append("")
+    if is_gas:
+        reservoir_count = math.ceil(storage_idle_kg / GAS_RESERVOIR_CAPACITY_KG)
+        ctx["idle_reservoirs"] = reservoir_count
+        ctx["idle_plural"] = "s" if reservoir_count != 1 else ""
 
     # Dormancy Cycle
-    lines.append("Dormancy Cycle (long-term):")
-
-    active_dur = format_duration(stats["active_duration_s"])
-    dormant_dur = format_duration(stats["dormant_duration_s"])
-    dormancy_cycle_dur = format_duration(stats["dormancy_cycle_s"])
-
-    kg_active_raw = stats["kg_per_active_period"]
-    if kg_active_raw >= 1000:
-        kg_active_str = f"{kg_active_raw / 1000:>7.1f} t"
-    else:
-        kg_active_str = f"{kg_active_raw:>7.1f} kg"
-
     thermal_active_str = ""
-    if thermal_stats and "thermal_per_eruption_kdtu" in thermal_stats:
+    if thermal_eruption_kdtu is not None:
         # Total thermal during active period
-        if stats["eruption_cycle_s"] > 0:
-            num_eruptions = stats["active_duration_s"] / stats["eruption_cycle_s"]
-            total_thermal_active = thermal_stats["thermal_per_eruption_kdtu"] * num_eruptions
+        if eruption_cycle_s > 0:
+            num_eruptions = active_duration_s / eruption_cycle_s
+            total_thermal_active = thermal_eruption_kdtu * num_eruptions
             thermal_active_str = f" @ {total_thermal_active:>11,.0f} kDTU"
 
-    lines.append(f"  Active:      {active_dur:>28}  → Produces {kg_active_str}{thermal_active_str}")
-    lines.append(f"  Dormant:     {dormant_dur:>28}  → Produces    0.0 kg")
-    lines.append(f"  Total cycle: {dormancy_cycle_dur:>28}")
-    lines.append(f"  Uptime:      {stats['active_uptime_percent']:>6.1f}%")
-    lines.append("")
-
-    # Storage for dormancy
-    storage_dormancy = format_mass(stats["storage_for_dormancy_kg"])
-    lines.append(f"  Storage for dormancy: {storage_dormancy}")
+    ctx["active_produces"] = _fmt_mass_padded(stats["kg_per_active_period"]) + thermal_active_str
 
     # Calculate reservoir and tile storage
-    if element_state == "Gas":
-        reservoir_count = math.ceil(stats["storage_for_dormancy_kg"] / GAS_RESERVOIR_CAPACITY_KG)
-        lines.append(
-            f"    - {reservoir_count} Gas Reservoir"
-            f"{'s' if reservoir_count != 1 else ''} (1,000 kg each)"
-        )
+    has_tiles = False
+    if is_gas:
+        reservoir_count = math.ceil(storage_dormancy_kg / GAS_RESERVOIR_CAPACITY_KG)
     else:  # Liquid
-        reservoir_count = math.ceil(stats["storage_for_dormancy_kg"] / LIQUID_RESERVOIR_CAPACITY_KG)
-        lines.append(
-            f"    - {reservoir_count} Liquid Reservoir"
-            f"{'s' if reservoir_count != 1 else ''} (5,000 kg each)"
-        )
+        reservoir_count = math.ceil(storage_dormancy_kg / LIQUID_RESERVOIR_CAPACITY_KG)
         if element_max_mass:
-            tile_count = math.ceil(stats["storage_for_dormancy_kg"] / element_max_mass)
-            lines.append(f"    - {tile_count} tiles @ {element_max_mass:,.0f} kg/tile max")
+            has_tiles = True
+            ctx["tile_count"] = math.ceil(storage_dormancy_kg / element_max_mass)
+            ctx["max_mass"] = f"{element_max_mass:,.0f}"
+    ctx["dormant_reservoirs"] = reservoir_count
+    ctx["dormant_plural"] = "s" if reservoir_count != 1 else ""
 
-    lines.append("")
+    out.write(_geyser_detailed_template(bool(thermal_stats), is_gas, has_tiles) % ctx)
 
-    # Overall summary
-    lines.append(
-        f"Overall Uptime: {stats['overall_uptime_percent']:.1f}% "
-        f"({stats['eruption_uptime_percent']:.1f}% erupting × "
-        f"{stats['active_uptime_percent']:.1f}% active)"
-    )
-    lines.append("")
 
-    # Recommended storage
-    recommended = format_mass(stats["recommended_storage_kg"])
-    buffer_type = (
-        "dormancy" if stats["storage_for_dormancy_kg"] > stats["storage_for_idle_kg"] else "idle"
-    )
-    lines.append(f"Recommended minimum storage: {recommended} ({buffer_type} buffer dominates)")
+@functools.lru_cache(maxsize=8)
+def _geyser_detailed_template(has_thermal: bool, is_gas: bool, has_tiles: bool) -> str:
+    """Join the detailed geyser sections for one combination of optional parts.
 
-    return "\n".join(lines)
+    Only a handful of combinations exist, so each geyser is rendered with a
+    single %-format of a prebuilt template instead of one per section.
+    """
+    sections = [_GEYSER_HEADER_TEMPLATE]
+    if has_thermal:
+        sections.append(_GEYSER_THERMAL_TEMPLATE)
+    sections.append(_GEYSER_ERUPTION_TEMPLATE)
+    if is_gas:
+        sections.append(_GEYSER_IDLE_GAS_TEMPLATE)
+    sections.append(_GEYSER_DORMANCY_TEMPLATE)
+    if is_gas:
+        sections.append(_GEYSER_DORMANT_GAS_TEMPLATE)
+    else:
+        sections.append(_GEYSER_DORMANT_LIQUID_TEMPLATE)
+        if has_tiles:
+            sections.append(_GEYSER_DORMANT_TILES_TEMPLATE)
+    sections.append(_GEYSER_SUMMARY_TEMPLATE)
+    return "".join(sections)
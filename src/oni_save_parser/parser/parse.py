@@ -1,9 +1,34 @@
 """Binary parsing primitives for reading ONI save files."""
 
 import struct
+from typing import Any
 
 from .errors import CorruptionError
 
+# Precompiled little-endian primitives, so reads skip format-string parsing
+_UINT32 = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+_UINT16 = struct.Struct("<H")
+_INT16 = struct.Struct("<h")
+_UINT64 = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_SINGLE = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_SBYTE = struct.Struct("b")
+
+# Longest klei string (in bytes) that BinaryParser keeps in its decode cache
+_MAX_CACHED_STRING = 64
+
+_UINT32_unpack_from = _UINT32.unpack_from
+_INT32_unpack_from = _INT32.unpack_from
+_UINT16_unpack_from = _UINT16.unpack_from
+_INT16_unpack_from = _INT16.unpack_from
+_UINT64_unpack_from = _UINT64.unpack_from
+_INT64_unpack_from = _INT64.unpack_from
+_SINGLE_unpack_from = _SINGLE.unpack_from
+_DOUBLE_unpack_from = _DOUBLE.unpack_from
+_SBYTE_unpack_from = _SBYTE.unpack_from
+
 
 class BinaryParser:
     """Low-level binary reader with offset tracking."""
@@ -14,15 +39,28 @@ class BinaryParser:
         Args:
             data: Raw binary data to parse
         """
-        self.data = data
+        # A view, so slices and string decodes do not copy the underlying data
+        self.data = memoryview(data)
         self.offset = 0
-
-    def _read_struct(self, fmt: str, size: int) -> tuple[int, ...]:
-        """Read structured data and advance offset.
+        # The data never changes, so bounds checks compare against a stored length
+        self._length = len(self.data)
+        # Decoded short strings by raw bytes: saves repeat the same class and
+        # field names thousands of times. Slices of a writable buffer are not
+        # hashable, so only read-only data is cached.
+        self._strings: dict[Any, str] | None = {} if self.data.readonly else None
+
+    def _end_of_data(self, size: int) -> CorruptionError:
+        """Build the error for a read of size bytes past the end of data."""
+        return CorruptionError(
+            f"Unexpected end of data (need {size} bytes, have {self._length - self.offset})",
+            offset=self.offset,
+        )
+
+    def read_struct(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        """Read several fixed-size fields with one precompiled struct.
 
         Args:
-            fmt: struct format string
-            size: number of bytes to read
+            fmt: Precompiled struct to unpack (include the "<" byte order)
 
         Returns:
             Tuple of unpacked values
@@ -30,76 +68,166 @@ class BinaryParser:
         Raises:
             CorruptionError: If trying to read past end of data
         """
-        if self.offset + size > len(self.data):
-            raise CorruptionError(
-                f"Unexpected end of data (need {size} bytes, have {len(self.data) - self.offset})",
-                offset=self.offset,
-            )
-        values = struct.unpack_from(fmt, self.data, self.offset)
-        self.offset += size
-        return values
+        offset = self.offset
+        end = offset + fmt.size
+        if end > self._length:
+            raise self._end_of_data(fmt.size)
+        self.offset = end
+        return fmt.unpack_from(self.data, offset)
+
+    # The primitive readers below inline read_struct: they are called millions
+    # of times per save, so skipping the extra call frame matters.
 
     def read_uint32(self) -> int:
         """Read unsigned 32-bit integer (little-endian)."""
-        return self._read_struct("<I", 4)[0]
+        offset = self.offset
+        end = offset + 4
+        if end > self._length:
+            raise self._end_of_data(4)
+        self.offset = end
+        value: int = _UINT32_unpack_from(self.data, offset)[0]
+        return value
 
     def read_int32(self) -> int:
         """Read signed 32-bit integer (little-endian)."""
-        return self._read_struct("<i", 4)[0]
+        offset = self.offset
+        end = offset + 4
+        if end > self._length:
+            raise self._end_of_data(4)
+        self.offset = end
+        value: int = _INT32_unpack_from(self.data, offset)[0]
+        return value
 
     def read_uint16(self) -> int:
         """Read unsigned 16-bit integer (little-endian)."""
-        return self._read_struct("<H", 2)[0]
+        offset = self.offset
+        end = offset + 2
+        if end > self._length:
+            raise self._end_of_data(2)
+        self.offset = end
+        value: int = _UINT16_unpack_from(self.data, offset)[0]
+        return value
 
     def read_int16(self) -> int:
         """Read signed 16-bit integer (little-endian)."""
-        return self._read_struct("<h", 2)[0]
+        offset = self.offset
+        end = offset + 2
+        if end > self._length:
+            raise self._end_of_data(2)
+        self.offset = end
+        value: int = _INT16_unpack_from(self.data, offset)[0]
+        return value
 
     def read_uint64(self) -> int:
         """Read unsigned 64-bit integer (little-endian)."""
-        return self._read_struct("<Q", 8)[0]
+        offset = self.offset
+        end = offset + 8
+        if end > self._length:
+            raise self._end_of_data(8)
+        self.offset = end
+        value: int = _UINT64_unpack_from(self.data, offset)[0]
+        return value
 
     def read_int64(self) -> int:
         """Read signed 64-bit integer (little-endian)."""
-        return self._read_struct("<q", 8)[0]
+        offset = self.offset
+        end = offset + 8
+        if end > self._length:
+            raise self._end_of_data(8)
+        self.offset = end
+        value: int = _INT64_unpack_from(self.data, offset)[0]
+        return value
 
     def read_single(self) -> float:
         """Read 32-bit floating point (little-endian)."""
-        return self._read_struct("<f", 4)[0]
+        offset = self.offset
+        end = offset + 4
+        if end > self._length:
+            raise self._end_of_data(4)
+        self.offset = end
+        value: float = _SINGLE_unpack_from(self.data, offset)[0]
+        return value
 
     def read_double(self) -> float:
         """Read 64-bit floating point (little-endian)."""
-        return self._read_struct("<d", 8)[0]
+        offset = self.offset
+        end = offset + 8
+        if end > self._length:
+            raise self._end_of_data(8)
+        self.offset = end
+        value: float = _DOUBLE_unpack_from(self.data, offset)[0]
+        return value
 
     def read_byte(self) -> int:
         """Read single unsigned byte."""
-        return self._read_struct("B", 1)[0]
+        offset = self.offset
+        if offset >= self._length:
+            raise self._end_of_data(1)
+        self.offset = offset + 1
+        return self.data[offset]
 
     def read_sbyte(self) -> int:
         """Read single signed byte."""
-        return self._read_struct("b", 1)[0]
+        offset = self.offset
+        if offset >= self._length:
+            raise self._end_of_data(1)
+        self.offset = offset + 1
+        value: int = _SBYTE_unpack_from(self.data, offset)[0]
+        return value
 
-    def read_bytes(self, count: int) -> bytes:
-        """Read raw bytes.
+    def _read_view(self, count: int) -> memoryview:
+        """Read a zero-copy view of the next count bytes.
 
         Args:
             count: Number of bytes to read
 
         Returns:
-            Raw bytes
+            View into the parser's data
 
         Raises:
             CorruptionError: If trying to read past end
         """
-        if self.offset + count > len(self.data):
-            raise CorruptionError(
-                f"Unexpected end of data (need {count} bytes, have {len(self.data) - self.offset})",
-                offset=self.offset,
-            )
+        if self.offset + count > self._length:
+            raise self._end_of_data(count)
         value = self.data[self.offset : self.offset + count]
         self.offset += count
         return value
 
+    def read_bytes(self, count: int) -> bytes:
+        """Read raw bytes.
+
+        Args:
+            count: Number of bytes to read
+
+        Returns:
+            Raw bytes
+
+        Raises:
+            CorruptionError: If trying to read past end
+        """
+        return bytes(self._read_view(count))
+
+    def read_array(self, code: str, count: int) -> tuple[Any, ...]:
+        """Read count consecutive little-endian primitives in one call.
+
+        Args:
+            code: struct format character of each element (e.g. "i", "f")
+            count: Number of elements to read
+
+        Returns:
+            Tuple of unpacked values
+
+        Raises:
+            CorruptionError: If trying to read past end
+        """
+        fmt = f"<{count}{code}"
+        size = struct.calcsize(fmt)
+        offset = self.offset
+        if offset + size > self._length:
+            raise self._end_of_data(size)
+        self.offset = offset + size
+        return struct.unpack_from(fmt, self.data, offset)
+
     def read_chars(self, count: int) -> str:
         """Read ASCII string of specific length.
 
@@ -109,7 +237,7 @@ class BinaryParser:
         Returns:
             ASCII string
         """
-        return self.read_bytes(count).decode("ascii")
+        return str(self._read_view(count), "ascii")
 
     def read_boolean(self) -> bool:
         """Read boolean as single byte."""
@@ -127,14 +255,33 @@ class BinaryParser:
         Raises:
             CorruptionError: If length is invalid (< -1)
         """
-        length = self.read_int32()
-        if length == -1:
-            return None
+        # Length read, checks and decode inlined: game objects hold many strings
+        data = self.data
+        data_length = self._length
+        offset = self.offset
+        start = offset + 4
+        if start > data_length:
+            raise self._end_of_data(4)
+        length = _INT32_unpack_from(data, offset)[0]
+        self.offset = start
+        if length > 0:
+            end = start + length
+            if end > data_length:
+                raise self._end_of_data(length)
+            self.offset = end
+            raw = data[start:end]
+            strings = self._strings
+            if strings is not None and length <= _MAX_CACHED_STRING:
+                value = strings.get(raw)
+                if value is None:
+                    value = strings[bytes(raw)] = str(raw, "utf-8")
+                return value
+            return str(raw, "utf-8")
         if length == 0:
             return ""
-        if length < 0:
-            raise CorruptionError(
-                f"Invalid string length {length} (must be >= -1)",
-                offset=self.offset - 4,
-            )
-        return self.read_bytes(length).decode("utf-8")
+        if length == -1:
+            return None
+        raise CorruptionError(
+            f"Invalid string length {length} (must be >= -1)",
+            offset=offset,
+        )
@@ -1,6 +1,19 @@
 """Binary writing primitives for writing ONI save files."""
 
 import struct
+from typing import Any
+
+# Precompiled little-endian primitives, so writes skip format-string parsing
+_UINT32 = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+_UINT16 = struct.Struct("<H")
+_INT16 = struct.Struct("<h")
+_UINT64 = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_SINGLE = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_BYTE = struct.Struct("B")
+_SBYTE = struct.Struct("b")
 
 
 class BinaryWriter:
@@ -8,41 +21,41 @@ class BinaryWriter:
 
     def __init__(self) -> None:
         """Initialize writer with empty buffer."""
-        self._buffer: list[bytes] = []
+        self._buffer = bytearray()
 
     @property
     def data(self) -> bytes:
         """Get accumulated binary data."""
-        return b"".join(self._buffer)
+        return bytes(self._buffer)
 
     @property
     def position(self) -> int:
         """Get current write position (total bytes written)."""
-        return len(self.data)
+        return len(self._buffer)
 
     def write_uint32(self, value: int) -> None:
         """Write unsigned 32-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<I", value))
+        self._buffer += _UINT32.pack(value)
 
     def write_int32(self, value: int) -> None:
         """Write signed 32-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<i", value))
+        self._buffer += _INT32.pack(value)
 
     def write_byte(self, value: int) -> None:
         """Write single unsigned byte."""
-        self._buffer.append(struct.pack("B", value))
+        self._buffer += _BYTE.pack(value)
 
     def write_sbyte(self, value: int) -> None:
         """Write single signed byte."""
-        self._buffer.append(struct.pack("b", value))
+        self._buffer += _SBYTE.pack(value)
 
     def write_bytes(self, value: bytes) -> None:
         """Write raw bytes."""
-        self._buffer.append(value)
+        self._buffer += value
 
     def write_chars(self, value: str) -> None:
         """Write ASCII string (no length prefix)."""
-        self._buffer.append(value.encode("ascii"))
+        self._buffer += value.encode("ascii")
 
     def write_klei_string(self, value: str | None) -> None:
         """Write length-prefixed UTF-8 string (ONI format).
@@ -61,27 +74,36 @@ class BinaryWriter:
 
     def write_uint16(self, value: int) -> None:
         """Write unsigned 16-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<H", value))
+        self._buffer += _UINT16.pack(value)
 
     def write_int16(self, value: int) -> None:
         """Write signed 16-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<h", value))
+        self._buffer += _INT16.pack(value)
 
     def write_uint64(self, value: int) -> None:
         """Write unsigned 64-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<Q", value))
+        self._buffer += _UINT64.pack(value)
 
     def write_int64(self, value: int) -> None:
         """Write signed 64-bit integer (little-endian)."""
-        self._buffer.append(struct.pack("<q", value))
+        self._buffer += _INT64.pack(value)
 
     def write_single(self, value: float) -> None:
         """Write 32-bit floating point (little-endian)."""
-        self._buffer.append(struct.pack("<f", value))
+        self._buffer += _SINGLE.pack(value)
 
     def write_double(self, value: float) -> None:
         """Write 64-bit floating point (little-endian)."""
-        self._buffer.append(struct.pack("<d", value))
+        self._buffer += _DOUBLE.pack(value)
+
+    def write_struct(self, fmt: struct.Struct, *values: Any) -> None:
+        """Write several fixed-size fields with one precompiled struct.
+
+        Args:
+            fmt: Precompiled struct to pack (include the "<" byte order)
+            *values: Field values, in struct order
+        """
+        self._buffer += fmt.pack(*values)
 
     def write_boolean(self, value: bool) -> None:
         """Write boolean as single byte."""
@@ -96,3 +118,29 @@ class BinaryWriter:
         self.write_int32(len(data))
         if data:
             self.write_bytes(data)
+
+    def reserve_length_prefix(self) -> int:
+        """Write a placeholder int32 length prefix to fill in later.
+
+        Lets callers write a length-prefixed section straight into this
+        writer instead of serializing it into a temporary writer first.
+
+        Returns:
+            Offset of the placeholder, for fill_length_prefix
+        """
+        prefix_offset = len(self._buffer)
+        self._buffer += b"\x00\x00\x00\x00"
+        return prefix_offset
+
+    def fill_length_prefix(self, prefix_offset: int, data_start: int | None = None) -> None:
+        """Back-patch a reserved length prefix with the bytes written since.
+
+        Args:
+            prefix_offset: Offset returned by reserve_length_prefix
+            data_start: Where the measured data starts (default: right after
+                the prefix). Used when fields between the prefix and the
+                data, such as an element count, are not counted.
+        """
+        if data_start is None:
+            data_start = prefix_offset + 4
+        _INT32.pack_into(self._buffer, prefix_offset, len(self._buffer) - data_start)
@@ -14,6 +14,8 @@ class CellRenderer:
             element_registry: Registry for element colors
         """
         self.element_registry = element_registry
+        # Final colors per (element, state); grids reuse a handful of pairs
+        self._colors: dict[tuple[str, ElementState], tuple[int, int, int]] = {}
 
     def render_cell(self, cell: Cell) -> tuple[int, int, int]:
         """
@@ -22,20 +24,37 @@ class CellRenderer:
         Args:
             cell: Cell to render
 
+        Returns:
+            RGB color tuple (r, g, b)
+        """
+        key = (cell.element, cell.state)
+        color = self._colors.get(key)
+        if color is None:
+            color = self._colors[key] = self._compute_color(cell.element, cell.state)
+        return color
+
+    def _compute_color(self, element: str, state: ElementState) -> tuple[int, int, int]:
+        """
+        Compute the color for an element in a given state.
+
+        Args:
+            element: Element name
+            state: Physical state of the element
+
         Returns:
             RGB color tuple (r, g, b)
         """
         # Get base color from registry
-        color = self.element_registry.get_color(cell.element)
+        color = self.element_registry.get_color(element)
 
         # Vacuum is always rendered as-is (black)
-        if cell.element == "Vacuum":
+        if element == "Vacuum":
             return color
 
         # Apply state-based visual effects
-        if cell.state == ElementState.LIQUID:
+        if state == ElementState.LIQUID:
             return self._apply_liquid_effect(color)
-        elif cell.state == ElementState.GAS:
+        elif state == ElementState.GAS:
             return self._apply_gas_effect(color)
         else:  # SOLID
             return color
@@ -10,9 +10,9 @@ class ElementState(Enum):
     GAS = "gas"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cell:
-    """Single grid cell in the world."""
+    """Single grid cell in the world (immutable, so equal cells can be shared)."""
     element: str
     state: ElementState
     temperature: float
@@ -5,7 +5,7 @@ from PIL import Image
 
 from oni_save_parser.assets.element_registry import ElementRegistry
 from oni_save_parser.rendering.cell_renderer import CellRenderer
-from oni_save_parser.rendering.models import AsteroidData
+from oni_save_parser.rendering.models import AsteroidData, ElementState
 
 
 class StaticRenderer:
@@ -35,29 +35,27 @@ class StaticRenderer:
             asteroid: Asteroid data to render
             output_path: Output file path
         """
-        # Calculate output dimensions
-        width = asteroid.width * self.scale
-        height = asteroid.height * self.scale
-
-        # Create image
-        img = Image.new("RGB", (width, height))
-        pixels = img.load()
-
-        if pixels is None:
-            raise RuntimeError("Failed to load image pixels")
-
-        # Render each cell
-        for y in range(asteroid.height):
-            for x in range(asteroid.width):
-                cell = asteroid.cells[y][x]
-                color = self.cell_renderer.render_cell(cell)
-
-                # Fill scaled tile
-                for dy in range(self.scale):
-                    for dx in range(self.scale):
-                        px = x * self.scale + dx
-                        py = y * self.scale + dy
-                        pixels[px, py] = color
+        # Render each cell to one RGB pixel, row by row. Colors depend only on
+        # (element, state), so pack each pair's pixel once and reuse it.
+        render_cell = self.cell_renderer.render_cell
+        pixels: dict[tuple[str, ElementState], bytes] = {}
+        rgb = bytearray()
+        for row in asteroid.cells:
+            for cell in row:
+                key = (cell.element, cell.state)
+                pixel = pixels.get(key)
+                if pixel is None:
+                    pixel = pixels[key] = bytes(render_cell(cell))
+                rgb += pixel
+
+        img = Image.frombytes("RGB", (asteroid.width, asteroid.height), bytes(rgb))
+
+        # Nearest-neighbour upscaling fills each scale x scale tile with its cell color
+        if self.scale > 1:
+            img = img.resize(
+                (asteroid.width * self.scale, asteroid.height * self.scale),
+                Image.Resampling.NEAREST,
+            )
 
         # Save image
         output_path = Path(output_path)
@@ -10,6 +10,35 @@ from oni_save_parser.rendering.models import (
     WorldModel,
 )
 
+# Common element hashes (discovered empirically)
+_ELEMENT_BY_HASH: dict[int, str] = {
+    0: "Vacuum",
+    1: "Granite",
+    2: "SandStone",
+    3: "Oxygen",
+    4: "CarbonDioxide",
+    5: "Water",
+    6: "Dirt",
+    7: "Sand",
+}
+
+# Physical state of known non-solid elements (Phase 1 heuristics)
+_STATE_BY_ELEMENT: dict[str, ElementState] = {
+    # Gas elements
+    **dict.fromkeys(
+        ("Oxygen", "CarbonDioxide", "Hydrogen", "ChlorineGas", "Steam", "Vacuum"),
+        ElementState.GAS,
+    ),
+    # Liquid elements
+    **dict.fromkeys(
+        ("Water", "DirtyWater", "SaltWater", "Brine", "CrudeOil", "Petroleum"),
+        ElementState.LIQUID,
+    ),
+}
+
+# Shared filler for grid positions beyond the parsed sim data
+_VACUUM_CELL = Cell("Vacuum", ElementState.GAS, 0.0, 0.0)
+
 
 class DataTransformer:
     """Transforms parsed save data into WorldModel."""
@@ -89,34 +118,43 @@ class DataTransformer:
         # sim_data contains element hashes, temperatures, masses, etc.
         element_hashes, temperatures, masses = self._parse_sim_data(save_data.sim_data, width, height)
 
-        # Build 2D grid
+        # Build 2D grid. Cells share a handful of element hashes, and state
+        # depends on mass only through mass == 0, so resolve each
+        # (hash, empty) pair once instead of once per cell. Cells are
+        # immutable, so identical (hash, temperature, mass) cells share
+        # one instance.
+        resolved: dict[tuple[int, bool], tuple[str, ElementState]] = {}
+        shared: dict[tuple[int, float, float], Cell] = {}
+        hash_count = len(element_hashes)
+        temp_count = len(temperatures)
+        mass_count = len(masses)
         cells: list[list[Cell]] = []
 
         for y in range(height):
             row: list[Cell] = []
-            for x in range(width):
-                idx = y * width + x
-
-                if idx < len(element_hashes):
-                    # Get element name
-                    element_hash = element_hashes[idx]
-                    element = self._hash_to_element(element_hash)
-
-                    # Get temperature
-                    temp = temperatures[idx] if idx < len(temperatures) else 0.0
-
-                    # Get mass
-                    mass = masses[idx] if idx < len(masses) else 0.0
-
-                    # Determine state from mass/element
-                    state = self._determine_state(element, mass)
-
-                    cell = Cell(element, state, temp, mass)
+            append = row.append
+            row_start = y * width
+            for idx in range(row_start, row_start + width):
+                if idx < hash_count:
+                    temp = temperatures[idx] if idx < temp_count else 0.0
+                    mass = masses[idx] if idx < mass_count else 0.0
+
+                    cell_key = (element_hashes[idx], temp, mass)
+                    cell = shared.get(cell_key)
+                    if cell is None:
+                        key = (cell_key[0], mass == 0.0)
+                        element_state = resolved.get(key)
+                        if element_state is None:
+                            element = self._hash_to_element(key[0])
+                            element_state = (element, self._determine_state(element, mass))
+                            resolved[key] = element_state
+                        cell = Cell(element_state[0], element_state[1], temp, mass)
+                        shared[cell_key] = cell
+
+                    append(cell)
                 else:
                     # Out of bounds - vacuum
-                    cell = Cell("Vacuum", ElementState.GAS, 0.0, 0.0)
-
-                row.append(cell)
+                    append(_VACUUM_CELL)
             cells.append(row)
 
         return width, height, cells
@@ -172,19 +210,10 @@ class DataTransformer:
         Phase 1: Return common element names for known hashes.
         Future: Load actual hash->name mapping.
         """
-        # Common element hashes (discovered empirically)
-        known_hashes = {
-            0: "Vacuum",
-            1: "Granite",
-            2: "SandStone",
-            3: "Oxygen",
-            4: "CarbonDioxide",
-            5: "Water",
-            6: "Dirt",
-            7: "Sand",
-        }
-
-        return known_hashes.get(element_hash, f"Element_{element_hash}")
+        element = _ELEMENT_BY_HASH.get(element_hash)
+        if element is None:
+            return f"Element_{element_hash}"
+        return element
 
     def _determine_state(self, element: str, mass: float) -> ElementState:
         """
@@ -196,13 +225,5 @@ class DataTransformer:
         if mass == 0.0:
             return ElementState.GAS
 
-        # Gas elements
-        if element in ("Oxygen", "CarbonDioxide", "Hydrogen", "ChlorineGas", "Steam", "Vacuum"):
-            return ElementState.GAS
-
-        # Liquid elements
-        if element in ("Water", "DirtyWater", "SaltWater", "Brine", "CrudeOil", "Petroleum"):
-            return ElementState.LIQUID
-
-        # Everything else is solid
-        return ElementState.SOLID
+        # Known gases and liquids; everything else is solid
+        return _STATE_BY_ELEMENT.get(element, ElementState.SOLID)
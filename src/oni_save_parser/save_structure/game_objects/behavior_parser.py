@@ -1,6 +1,7 @@
 """Game object behavior parsing."""
 
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from oni_save_parser.parser.errors import CorruptionError
@@ -17,7 +18,8 @@ from oni_save_parser.save_structure.type_templates.template_parser import (
 )
 
 
-# Forward references to avoid circular import
+# Forward references to avoid circular import; cached so the import runs only once
+@cache
 def _get_parse_game_object() -> Callable[[BinaryParser, list[TypeTemplate]], GameObject]:
     """Get parse_game_object function (lazy import to avoid circular dependency)."""
     from oni_save_parser.save_structure.game_objects.object_parser import parse_game_object
@@ -25,6 +27,7 @@ def _get_parse_game_object() -> Callable[[BinaryParser, list[TypeTemplate]], Gam
     return parse_game_object
 
 
+@cache
 def _get_unparse_game_object() -> Callable[[BinaryWriter, list[TypeTemplate], GameObject], None]:
     """Get unparse_game_object function (lazy import to avoid circular dependency)."""
     from oni_save_parser.save_structure.game_objects.object_parser import unparse_game_object
@@ -32,6 +35,72 @@ def _get_unparse_game_object() -> Callable[[BinaryWriter, list[TypeTemplate], Ga
     return unparse_game_object
 
 
+def _parse_storage_extra(
+    parser: BinaryParser, templates: list[TypeTemplate]
+) -> list[dict[str, Any]]:
+    """Parse Storage extra data: the stored GameObjects, each with its prefab name."""
+    item_count = parser.read_int32()
+    if item_count == 0:
+        # Empty storage
+        return []
+
+    # Parse stored items (each is a prefab name + GameObject)
+    parse_game_object = _get_parse_game_object()
+    items = []
+    for _ in range(item_count):
+        # Read prefab name
+        prefab_name = parser.read_klei_string()
+        if prefab_name is None:
+            msg = "Expected prefab name for stored item, got null"
+            raise CorruptionError(msg, offset=parser.offset)
+        prefab_name = validate_dotnet_identifier_name(prefab_name)
+
+        # Parse GameObject
+        game_obj = parse_game_object(parser, templates)
+
+        # Store as dict with name and GameObject fields
+        items.append(
+            {
+                "name": prefab_name,
+                "position": game_obj.position,
+                "rotation": game_obj.rotation,
+                "scale": game_obj.scale,
+                "folder": game_obj.folder,
+                "behaviors": game_obj.behaviors,
+            }
+        )
+    return items
+
+
+def _unparse_storage_extra(
+    writer: BinaryWriter, templates: list[TypeTemplate], extra_data: list[dict[str, Any]]
+) -> None:
+    """Write Storage extra data: the stored GameObjects, each with its prefab name."""
+    unparse_game_object = _get_unparse_game_object()
+    writer.write_int32(len(extra_data))  # Item count
+    for stored_obj in extra_data:
+        # Write prefab name
+        writer.write_klei_string(stored_obj["name"])
+        # Write GameObject (reconstruct from dict)
+        game_obj = GameObject(
+            position=stored_obj["position"],
+            rotation=stored_obj["rotation"],
+            scale=stored_obj["scale"],
+            folder=stored_obj["folder"],
+            behaviors=stored_obj["behaviors"],
+        )
+        unparse_game_object(writer, templates, game_obj)
+
+
+# Extra data handlers for behaviors that store more than their template data
+_EXTRA_DATA_PARSERS: dict[str, Callable[[BinaryParser, list[TypeTemplate]], Any]] = {
+    "Storage": _parse_storage_extra,
+}
+_EXTRA_DATA_UNPARSERS: dict[str, Callable[[BinaryWriter, list[TypeTemplate], Any], None]] = {
+    "Storage": _unparse_storage_extra,
+}
+
+
 def parse_behavior(parser: BinaryParser, templates: list[TypeTemplate]) -> GameObjectBehavior:
     """Parse a single game object behavior (component).
 
@@ -66,7 +135,7 @@ def parse_behavior(parser: BinaryParser, templates: list[TypeTemplate]) -> GameO
     except CorruptionError:
         # If template not found, skip the entire data block
         parser.offset = start_offset + data_length
-        extra_raw = parser.data[start_offset : parser.offset]
+        extra_raw = bytes(parser.data[start_offset : parser.offset])
         return GameObjectBehavior(
             name=name, template_data=None, extra_data=None, extra_raw=extra_raw
         )
@@ -74,39 +143,9 @@ def parse_behavior(parser: BinaryParser, templates: list[TypeTemplate]) -> GameO
     # Parse extra data for specific behavior types
     extra_data: Any = None
 
-    if name == "Storage":
-        # Storage has array of stored GameObjects
-        item_count = parser.read_int32()
-        if item_count == 0:
-            # Empty storage
-            extra_data = []
-        else:
-            # Parse stored items (each is a prefab name + GameObject)
-            parse_game_object = _get_parse_game_object()
-            items = []
-            for _ in range(item_count):
-                # Read prefab name
-                prefab_name = parser.read_klei_string()
-                if prefab_name is None:
-                    msg = "Expected prefab name for stored item, got null"
-                    raise CorruptionError(msg, offset=parser.offset)
-                prefab_name = validate_dotnet_identifier_name(prefab_name)
-
-                # Parse GameObject
-                game_obj = parse_game_object(parser, templates)
-
-                # Store as dict with name and GameObject fields
-                items.append(
-                    {
-                        "name": prefab_name,
-                        "position": game_obj.position,
-                        "rotation": game_obj.rotation,
-                        "scale": game_obj.scale,
-                        "folder": game_obj.folder,
-                        "behaviors": game_obj.behaviors,
-                    }
-                )
-            extra_data = items
+    extra_parser = _EXTRA_DATA_PARSERS.get(name)
+    if extra_parser is not None:
+        extra_data = extra_parser(parser, templates)
 
     # Capture remaining data as raw bytes
     bytes_consumed = parser.offset - start_offset
@@ -142,35 +181,21 @@ def unparse_behavior(
     # Write behavior name
     writer.write_klei_string(behavior.name)
 
-    # Build behavior data in temporary buffer to measure length
-    data_writer = BinaryWriter()
+    # Write behavior data after a length prefix that is filled in afterwards
+    length_prefix = writer.reserve_length_prefix()
 
     # Write template data
     if behavior.template_data is not None:
-        unparse_by_template(data_writer, templates, behavior.name, behavior.template_data)
+        unparse_by_template(writer, templates, behavior.name, behavior.template_data)
 
     # Write extra data for specific behavior types
-    if behavior.name == "Storage" and behavior.extra_data is not None:
-        # Storage extra_data is list of stored GameObjects
-        unparse_game_object = _get_unparse_game_object()
-        data_writer.write_int32(len(behavior.extra_data))  # Item count
-        for stored_obj in behavior.extra_data:
-            # Write prefab name
-            data_writer.write_klei_string(stored_obj["name"])
-            # Write GameObject (reconstruct from dict)
-            game_obj = GameObject(
-                position=stored_obj["position"],
-                rotation=stored_obj["rotation"],
-                scale=stored_obj["scale"],
-                folder=stored_obj["folder"],
-                behaviors=stored_obj["behaviors"],
-            )
-            unparse_game_object(data_writer, templates, game_obj)
+    if behavior.extra_data is not None:
+        extra_unparser = _EXTRA_DATA_UNPARSERS.get(behavior.name)
+        if extra_unparser is not None:
+            extra_unparser(writer, templates, behavior.extra_data)
 
     # Write extra raw data
     if behavior.extra_raw:
-        data_writer.write_bytes(behavior.extra_raw)
+        writer.write_bytes(behavior.extra_raw)
 
-    # Write data length and data
-    writer.write_int32(len(data_writer.data))
-    writer.write_bytes(data_writer.data)
+    writer.fill_length_prefix(length_prefix)
@@ -1,5 +1,7 @@
 """Game object group parsing."""
 
+from collections.abc import Collection
+
 from oni_save_parser.parser.errors import CorruptionError
 from oni_save_parser.parser.parse import BinaryParser
 from oni_save_parser.parser.unparse import BinaryWriter
@@ -14,7 +16,11 @@ from oni_save_parser.save_structure.type_templates.template_parser import (
 )
 
 
-def parse_game_object_group(parser: BinaryParser, templates: list[TypeTemplate]) -> GameObjectGroup:
+def parse_game_object_group(
+    parser: BinaryParser,
+    templates: list[TypeTemplate],
+    lazy_prefabs: Collection[str] | None = None,
+) -> GameObjectGroup:
     """Parse a game object group.
 
     Groups contain multiple instances of the same prefab type.
@@ -22,6 +28,8 @@ def parse_game_object_group(parser: BinaryParser, templates: list[TypeTemplate])
     Args:
         parser: Binary parser positioned at group data
         templates: Type templates for behavior deserialization
+        lazy_prefabs: Prefab names whose objects are kept as raw bytes instead
+            of being parsed (for round-tripping groups that are not inspected)
 
     Returns:
         Parsed game object group
@@ -36,6 +44,7 @@ def parse_game_object_group(parser: BinaryParser, templates: list[TypeTemplate])
     prefab_name = validate_dotnet_identifier_name(prefab_name_raw)
 
     # Read instance count
+    count_offset = parser.offset
     instance_count = parser.read_int32()
     if instance_count < 0:
         msg = f"Invalid instance count for prefab {prefab_name}: {instance_count}"
@@ -48,14 +57,17 @@ def parse_game_object_group(parser: BinaryParser, templates: list[TypeTemplate])
             f"Invalid data length for prefab {prefab_name}: {data_length}", offset=parser.offset
         )
 
+    # Lazy groups keep count, length and object data verbatim
+    if lazy_prefabs is not None and prefab_name in lazy_prefabs:
+        parser.offset = count_offset
+        raw_data = parser.read_bytes(8 + data_length)
+        return GameObjectGroup(prefab_name=prefab_name, objects=[], raw_data=raw_data)
+
     # Track start position for length validation
     start_offset = parser.offset
 
     # Parse game objects
-    objects = []
-    for _ in range(instance_count):
-        obj = parse_game_object(parser, templates)
-        objects.append(obj)
+    objects = [parse_game_object(parser, templates) for _ in range(instance_count)]
 
     # Validate data length
     bytes_consumed = parser.offset - start_offset
@@ -78,18 +90,30 @@ def unparse_game_object_group(
         writer: Binary writer to append to
         templates: Type templates for behavior serialization
         group: Game object group to write
+
+    Raises:
+        ValueError: If a lazily loaded group has objects added to it
     """
+    # Lazily loaded groups are written back unchanged, so added objects would be lost
+    if group.raw_data is not None and group.objects:
+        raise ValueError(
+            f"Game object group {group.prefab_name} was loaded lazily; "
+            f"its {len(group.objects)} added object(s) cannot be saved"
+        )
+
     # Write prefab name
     writer.write_klei_string(group.prefab_name)
 
+    # Lazily loaded groups are written back unchanged
+    if group.raw_data is not None:
+        writer.write_bytes(group.raw_data)
+        return
+
     # Write instance count
     writer.write_int32(len(group.objects))
 
-    # Build group data in temporary buffer to measure length
-    data_writer = BinaryWriter()
+    # Write group data after a length prefix that is filled in afterwards
+    length_prefix = writer.reserve_length_prefix()
     for obj in group.objects:
-        unparse_game_object(data_writer, templates, obj)
-
-    # Write data length and data
-    writer.write_int32(len(data_writer.data))
-    writer.write_bytes(data_writer.data)
+        unparse_game_object(writer, templates, obj)
+    writer.fill_length_prefix(length_prefix)
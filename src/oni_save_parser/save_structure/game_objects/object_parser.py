@@ -1,5 +1,7 @@
 """Game object parsing."""
 
+import struct
+
 from oni_save_parser.parser.errors import CorruptionError
 from oni_save_parser.parser.parse import BinaryParser
 from oni_save_parser.parser.unparse import BinaryWriter
@@ -10,21 +12,23 @@ from oni_save_parser.save_structure.game_objects.behavior_parser import (
 from oni_save_parser.save_structure.game_objects.types import GameObject, Quaternion, Vector3
 from oni_save_parser.save_structure.type_templates import TypeTemplate
 
+# Vectors and quaternions are read and written as one struct each
+_VECTOR3 = struct.Struct("<3f")
+_QUATERNION = struct.Struct("<4f")
+# A game object's fixed-size prefix: position, rotation and scale back to back,
+# then the folder byte and behavior count
+_PREFIX = struct.Struct("<10fBi")
+
 
 def parse_vector3(parser: BinaryParser) -> Vector3:
     """Parse a Vector3 (3 floats)."""
-    x = parser.read_single()
-    y = parser.read_single()
-    z = parser.read_single()
+    x, y, z = parser.read_struct(_VECTOR3)
     return Vector3(x=x, y=y, z=z)
 
 
 def parse_quaternion(parser: BinaryParser) -> Quaternion:
     """Parse a Quaternion (4 floats)."""
-    x = parser.read_single()
-    y = parser.read_single()
-    z = parser.read_single()
-    w = parser.read_single()
+    x, y, z, w = parser.read_struct(_QUATERNION)
     return Quaternion(x=x, y=y, z=z, w=w)
 
 
@@ -41,23 +45,18 @@ def parse_game_object(parser: BinaryParser, templates: list[TypeTemplate]) -> Ga
     Raises:
         CorruptionError: If game object data is invalid
     """
-    # Parse transform
-    position = parse_vector3(parser)
-    rotation = parse_quaternion(parser)
-    scale = parse_vector3(parser)
-
-    # Parse folder (0-255, used to look up Unity prefab)
-    folder = parser.read_byte()
+    # Parse transform (position, rotation, scale), folder (0-255, used to look up
+    # Unity prefab) and behavior count in one read
+    px, py, pz, rx, ry, rz, rw, sx, sy, sz, folder, behavior_count = parser.read_struct(_PREFIX)
+    position = Vector3(x=px, y=py, z=pz)
+    rotation = Quaternion(x=rx, y=ry, z=rz, w=rw)
+    scale = Vector3(x=sx, y=sy, z=sz)
 
     # Parse behaviors
-    behavior_count = parser.read_int32()
     if behavior_count < 0:
         raise CorruptionError(f"Invalid behavior count: {behavior_count}", offset=parser.offset)
 
-    behaviors = []
-    for _ in range(behavior_count):
-        behavior = parse_behavior(parser, templates)
-        behaviors.append(behavior)
+    behaviors = [parse_behavior(parser, templates) for _ in range(behavior_count)]
 
     return GameObject(
         position=position, rotation=rotation, scale=scale, folder=folder, behaviors=behaviors
@@ -66,17 +65,12 @@ def parse_game_object(parser: BinaryParser, templates: list[TypeTemplate]) -> Ga
 
 def unparse_vector3(writer: BinaryWriter, vector: Vector3) -> None:
     """Write a Vector3 (3 floats)."""
-    writer.write_single(vector.x)
-    writer.write_single(vector.y)
-    writer.write_single(vector.z)
+    writer.write_struct(_VECTOR3, vector.x, vector.y, vector.z)
 
 
 def unparse_quaternion(writer: BinaryWriter, quaternion: Quaternion) -> None:
     """Write a Quaternion (4 floats)."""
-    writer.write_single(quaternion.x)
-    writer.write_single(quaternion.y)
-    writer.write_single(quaternion.z)
-    writer.write_single(quaternion.w)
+    writer.write_struct(_QUATERNION, quaternion.x, quaternion.y, quaternion.z, quaternion.w)
 
 
 def unparse_game_object(
@@ -89,15 +83,24 @@ def unparse_game_object(
         templates: Type templates for behavior serialization
         obj: Game object to write
     """
-    # Write transform
-    unparse_vector3(writer, obj.position)
-    unparse_quaternion(writer, obj.rotation)
-    unparse_vector3(writer, obj.scale)
-
-    # Write folder
-    writer.write_byte(obj.folder)
+    # Write transform (position, rotation, scale), folder and behavior count in one write
+    position, rotation, scale = obj.position, obj.rotation, obj.scale
+    writer.write_struct(
+        _PREFIX,
+        position.x,
+        position.y,
+        position.z,
+        rotation.x,
+        rotation.y,
+        rotation.z,
+        rotation.w,
+        scale.x,
+        scale.y,
+        scale.z,
+        obj.folder,
+        len(obj.behaviors),
+    )
 
     # Write behaviors
-    writer.write_int32(len(obj.behaviors))
     for behavior in obj.behaviors:
         unparse_behavior(writer, templates, behavior)
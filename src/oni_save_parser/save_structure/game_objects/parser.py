@@ -1,5 +1,7 @@
 """Top-level game objects parsing."""
 
+from collections.abc import Collection
+
 from oni_save_parser.parser.errors import CorruptionError
 from oni_save_parser.parser.parse import BinaryParser
 from oni_save_parser.parser.unparse import BinaryWriter
@@ -12,20 +14,31 @@ from oni_save_parser.save_structure.type_templates import TypeTemplate
 
 
 def parse_game_objects(
-    parser: BinaryParser, templates: list[TypeTemplate]
+    parser: BinaryParser,
+    templates: list[TypeTemplate],
+    lazy_prefabs: Collection[str] | None = None,
 ) -> list[GameObjectGroup]:
     """Parse all game object groups.
 
     Args:
         parser: Binary parser positioned at game objects data
         templates: Type templates for behavior deserialization
+        lazy_prefabs: Prefab names whose groups are kept as raw bytes and written
+            back unchanged, skipping both parse and unparse of their objects
 
     Returns:
         List of game object groups
 
     Raises:
         CorruptionError: If game objects data is invalid
+        TypeError: If lazy_prefabs is a single string rather than a collection
     """
+    # A bare string is a Collection[str] too, but would match by substring
+    if isinstance(lazy_prefabs, str):
+        raise TypeError(f"lazy_prefabs must be a collection of prefab names, not {lazy_prefabs!r}")
+    if lazy_prefabs is not None:
+        lazy_prefabs = frozenset(lazy_prefabs)
+
     # Read group count
     group_count = parser.read_int32()
     if group_count < 0:
@@ -33,12 +46,7 @@ def parse_game_objects(
         raise CorruptionError(msg, offset=parser.offset)
 
     # Parse groups
-    groups = []
-    for _ in range(group_count):
-        group = parse_game_object_group(parser, templates)
-        groups.append(group)
-
-    return groups
+    return [parse_game_object_group(parser, templates, lazy_prefabs) for _ in range(group_count)]
 
 
 def unparse_game_objects(
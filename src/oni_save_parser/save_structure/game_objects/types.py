@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3:
     """3D vector (position or scale)."""
 
@@ -13,7 +13,7 @@ class Vector3:
     z: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Quaternion:
     """Quaternion rotation (4 floats)."""
 
@@ -23,7 +23,7 @@ class Quaternion:
     w: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GameObjectBehavior:
     """Component attached to a game object.
 
@@ -37,7 +37,7 @@ class GameObjectBehavior:
     extra_raw: bytes  # Unparsed extra data (preserved as-is)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameObject:
     """Game entity in the ONI world.
 
@@ -51,7 +51,7 @@ class GameObject:
     behaviors: list[GameObjectBehavior]  # Attached components
 
 
-@dataclass
+@dataclass(slots=True)
 class GameObjectGroup:
     """Group of game objects with the same prefab.
 
@@ -60,4 +60,14 @@ class GameObjectGroup:
     """
 
     prefab_name: str  # Unity prefab name (e.g., "Minion", "Tile", "Door")
-    objects: list[GameObject]  # Instances of this prefab type
+    objects: list[GameObject]  # Instances of this prefab type (empty if loaded lazily)
+    # Instance count, data length and object data, kept verbatim for groups loaded
+    # lazily (see parse_game_objects); written back as-is instead of objects
+    raw_data: bytes | None = None
+
+    @property
+    def instance_count(self) -> int:
+        """Number of instances, including those of a lazily loaded group."""
+        if self.raw_data is not None:
+            return int.from_bytes(self.raw_data[:4], "little", signed=True)
+        return len(self.objects)
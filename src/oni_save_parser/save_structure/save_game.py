@@ -1,6 +1,7 @@
 """Main save game data structure."""
 
 import zlib
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any
 
@@ -41,7 +42,10 @@ class SaveGame:
 
 
 def parse_save_game(
-    data: bytes, verify_version: bool = True, allow_minor_mismatch: bool = False
+    data: bytes,
+    verify_version: bool = True,
+    allow_minor_mismatch: bool = False,
+    lazy_prefabs: Collection[str] | None = None,
 ) -> SaveGame:
     """Parse complete ONI save game.
 
@@ -49,6 +53,8 @@ def parse_save_game(
         data: Raw save file bytes
         verify_version: Whether to verify save version compatibility
         allow_minor_mismatch: If True, allow different minor versions (less safe)
+        lazy_prefabs: Prefab names whose game object groups are kept as raw bytes
+            (with empty objects) and written back unchanged
 
     Returns:
         Parsed save game structure
@@ -80,7 +86,7 @@ def parse_save_game(
 
     # Parse body (potentially compressed)
     if header.is_compressed:
-        # Read remaining data and decompress
+        # Decompress the remaining data straight from the parser's view
         body_data = parser.data[parser.offset :]
         try:
             decompressed = zlib.decompress(body_data, wbits=15)
@@ -99,7 +105,7 @@ def parse_save_game(
         version_minor,
         game_objects,
         game_data,
-    ) = _parse_save_body(body_parser, templates)
+    ) = _parse_save_body(body_parser, templates, lazy_prefabs)
 
     return SaveGame(
         header=header,
@@ -115,7 +121,9 @@ def parse_save_game(
 
 
 def _parse_save_body(
-    parser: BinaryParser, templates: list[TypeTemplate]
+    parser: BinaryParser,
+    templates: list[TypeTemplate],
+    lazy_prefabs: Collection[str] | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any], bytes, int, int, list[GameObjectGroup], bytes]:
     """Parse save game body.
 
@@ -170,11 +178,11 @@ def _parse_save_body(
     version_minor = parser.read_int32()
 
     # Parse game objects
-    game_objects = parse_game_objects(parser, templates)
+    game_objects = parse_game_objects(parser, templates, lazy_prefabs)
 
     # Game data - remaining data
     # TODO: Implement game data parser (Phase 4.3)
-    game_data = parser.data[parser.offset :]
+    game_data = bytes(parser.data[parser.offset :])
 
     return (
         world,
@@ -205,15 +213,14 @@ def unparse_save_game(save_game: SaveGame) -> bytes:
     unparse_templates(writer, save_game.templates)
 
     # Write body (potentially compress)
-    body_writer = BinaryWriter()
-    _unparse_save_body(body_writer, save_game)
-
     if save_game.header.is_compressed:
-        # Compress body
+        # Compress body; only this path needs it serialized on its own
+        body_writer = BinaryWriter()
+        _unparse_save_body(body_writer, save_game)
         compressed = zlib.compress(body_writer.data, level=9, wbits=15)
         writer.write_bytes(compressed)
     else:
-        writer.write_bytes(body_writer.data)
+        _unparse_save_body(writer, save_game)
 
     return writer.data
 
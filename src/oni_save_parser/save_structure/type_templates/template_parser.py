@@ -1,6 +1,8 @@
 """TypeTemplate binary parsing and unparsing."""
 
 import re
+import sys
+from functools import lru_cache
 
 from oni_save_parser.parser.errors import CorruptionError
 from oni_save_parser.parser.parse import BinaryParser
@@ -18,6 +20,9 @@ from oni_save_parser.save_structure.type_templates.types import (
 REGEX_IDENTIFIER_INVAL_CHARS = re.compile(r"[\x00-\x1F]")
 
 
+# Saves repeat about a thousand distinct names across every object and behavior.
+# Invalid names raise, so they are never cached.
+@lru_cache(maxsize=4096)
 def validate_dotnet_identifier_name(name: str | None) -> str:
     """Validate a .NET identifier name.
 
@@ -25,7 +30,7 @@ def validate_dotnet_identifier_name(name: str | None) -> str:
         name: Identifier name to validate
 
     Returns:
-        Validated name
+        Validated name (interned)
 
     Raises:
         CorruptionError: If name is invalid
@@ -50,7 +55,8 @@ def validate_dotnet_identifier_name(name: str | None) -> str:
             "This most likely indicates a parser error",
         )
 
-    return name
+    # Interned, so every behavior, prefab and field name shares one object
+    return sys.intern(name)
 
 
 def parse_template(parser: BinaryParser) -> TypeTemplate:
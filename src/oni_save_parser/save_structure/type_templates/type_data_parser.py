@@ -16,6 +16,21 @@ from oni_save_parser.save_structure.type_templates.types import (
     is_value_type,
 )
 
+# struct format characters for primitive element types that arrays can read in bulk
+_PRIMITIVE_ARRAY_CODES = {
+    SerializationTypeCode.SByte: "b",
+    SerializationTypeCode.Boolean: "?",
+    SerializationTypeCode.Int16: "h",
+    SerializationTypeCode.UInt16: "H",
+    SerializationTypeCode.Int32: "i",
+    SerializationTypeCode.UInt32: "I",
+    SerializationTypeCode.Int64: "q",
+    SerializationTypeCode.UInt64: "Q",
+    SerializationTypeCode.Single: "f",
+    SerializationTypeCode.Double: "d",
+    SerializationTypeCode.Enumeration: "i",
+}
+
 
 def parse_by_template(
     parser: BinaryParser, templates: list[TypeTemplate], template_name: str
@@ -128,6 +143,11 @@ def _parse_array_like(
             elements.append(element)
         return elements
 
+    # Fixed-size primitives are read in one bulk unpack
+    array_code = _PRIMITIVE_ARRAY_CODES.get(get_type_code(element_type.info))
+    if array_code is not None:
+        return list(parser.read_array(array_code, length))
+
     # Reference types include data-length on each element
     elements = []
     for _ in range(length):
@@ -159,32 +179,33 @@ def _unparse_array_like(
         writer.write_int32(-1)
         return
 
-    # Write elements to temporary buffer to measure length
-    temp_writer = BinaryWriter()
+    is_byte_array = get_type_code(element_type.info) == SerializationTypeCode.Byte
+    if is_byte_array and not isinstance(values, bytes):
+        raise CorruptionError("Expected bytes for byte array")
 
-    if get_type_code(element_type.info) == SerializationTypeCode.Byte:
+    # Data-length (element count is NOT included), filled in after the elements
+    length_prefix = writer.reserve_length_prefix()
+    # Write element count
+    writer.write_int32(len(values))
+    data_start = writer.position
+
+    if is_byte_array:
         # Byte arrays
-        if not isinstance(values, bytes):
-            raise CorruptionError("Expected bytes for byte array")
-        temp_writer.write_bytes(values)
+        assert isinstance(values, bytes)
+        writer.write_bytes(values)
     elif is_value_type(element_type.info):
         # Value types
         assert element_type.template_name is not None
         assert isinstance(values, list), "Value type arrays must be lists"
         for element in values:
-            unparse_by_template(temp_writer, templates, element_type.template_name, element)
+            unparse_by_template(writer, templates, element_type.template_name, element)
     else:
         # Reference types
         assert isinstance(values, list), "Reference type arrays must be lists"
         for element in values:
-            unparse_by_type(temp_writer, templates, element, element_type)
+            unparse_by_type(writer, templates, element, element_type)
 
-    # Write data-length (element count is NOT included)
-    writer.write_int32(len(temp_writer.data))
-    # Write element count
-    writer.write_int32(len(values))
-    # Write elements
-    writer.write_bytes(temp_writer.data)
+    writer.fill_length_prefix(length_prefix, data_start)
 
 
 def parse_by_type(parser: BinaryParser, templates: list[TypeTemplate], type_info: TypeInfo) -> Any:
@@ -419,22 +440,20 @@ def unparse_by_type(
             writer.write_int32(-1)
             return
 
-        # Write to temp buffer to measure
-        temp_writer = BinaryWriter()
+        # Data-length (element count NOT included), filled in after the data
+        length_prefix = writer.reserve_length_prefix()
+        # Write element count
+        writer.write_int32(len(value))
+        data_start = writer.position
 
         # Values first
         for key, val in value:
-            unparse_by_type(temp_writer, templates, val, value_type)
+            unparse_by_type(writer, templates, val, value_type)
         # Then keys
         for key, val in value:
-            unparse_by_type(temp_writer, templates, key, key_type)
+            unparse_by_type(writer, templates, key, key_type)
 
-        # Write data-length (element count NOT included)
-        writer.write_int32(len(temp_writer.data))
-        # Write element count
-        writer.write_int32(len(value))
-        # Write data
-        writer.write_bytes(temp_writer.data)
+        writer.fill_length_prefix(length_prefix, data_start)
 
     # Pair
     elif type_code == SerializationTypeCode.Pair:
@@ -446,14 +465,11 @@ def unparse_by_type(
             writer.write_int32(-1)
             return
 
-        # Write to temp buffer to measure
-        temp_writer = BinaryWriter()
-        unparse_by_type(temp_writer, templates, value["key"], key_type)
-        unparse_by_type(temp_writer, templates, value["value"], value_type)
-
-        # Write data-length then data
-        writer.write_int32(len(temp_writer.data))
-        writer.write_bytes(temp_writer.data)
+        # Write data-length (filled in afterwards) then data
+        length_prefix = writer.reserve_length_prefix()
+        unparse_by_type(writer, templates, value["key"], key_type)
+        unparse_by_type(writer, templates, value["value"], value_type)
+        writer.fill_length_prefix(length_prefix)
 
     # UserDefined
     elif type_code == SerializationTypeCode.UserDefined:
@@ -463,13 +479,10 @@ def unparse_by_type(
             writer.write_int32(-1)
             return
 
-        # Write to temp buffer to measure
-        temp_writer = BinaryWriter()
-        unparse_by_template(temp_writer, templates, type_info.template_name, value)
-
-        # Write data-length then data
-        writer.write_int32(len(temp_writer.data))
-        writer.write_bytes(temp_writer.data)
+        # Write data-length (filled in afterwards) then data
+        length_prefix = writer.reserve_length_prefix()
+        unparse_by_template(writer, templates, type_info.template_name, value)
+        writer.fill_length_prefix(length_prefix)
 
     else:
         raise CorruptionError(f"Unknown type code {type_code} (typeinfo: {type_info.info})")
@@ -61,3 +61,16 @@ def test_render_vacuum_cell() -> None:
 
     # Vacuum should be black
     assert color == (0, 0, 0)
+
+
+def test_render_cell_caches_per_element_and_state() -> None:
+    """Test cached colors are keyed on both element and state."""
+    registry = ElementRegistry()
+    renderer = CellRenderer(registry)
+
+    solid = renderer.render_cell(Cell("Water", ElementState.SOLID, 250.0, 1000.0))
+    liquid = renderer.render_cell(Cell("Water", ElementState.LIQUID, 298.0, 1000.0))
+
+    assert solid == registry.get_color("Water")
+    assert liquid != solid
+    assert renderer.render_cell(Cell("Water", ElementState.LIQUID, 300.0, 500.0)) == liquid
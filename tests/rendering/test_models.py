@@ -1,4 +1,8 @@
 """Tests for rendering data models."""
+import dataclasses
+
+import pytest
+
 from oni_save_parser.rendering.models import (
     Cell,
     ElementState,
@@ -22,6 +26,15 @@ def test_cell_creation() -> None:
     assert cell.mass == 1.0
 
 
+def test_cell_is_immutable_and_slotted() -> None:
+    """Test Cell has no instance dict and rejects mutation."""
+    cell = Cell("Oxygen", ElementState.GAS, 300.0, 1.0)
+    assert not hasattr(cell, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cell.mass = 2.0  # type: ignore[misc]
+    assert cell == Cell("Oxygen", ElementState.GAS, 300.0, 1.0)
+
+
 def test_element_state_enum() -> None:
     """Test ElementState enum values."""
     assert ElementState.SOLID.value == "solid"
@@ -93,3 +93,21 @@ def test_determine_state_zero_mass() -> None:
     assert transformer._determine_state("Granite", 0.0) == ElementState.GAS
     assert transformer._determine_state("Water", 0.0) == ElementState.GAS
     assert transformer._determine_state("Oxygen", 0.0) == ElementState.GAS
+
+
+def test_extract_grid_shares_identical_cells() -> None:
+    """Test that identical cells in the grid are a single shared instance."""
+    from types import SimpleNamespace
+
+    registry = ElementRegistry()
+    transformer = DataTransformer(registry)
+    save_data = SimpleNamespace(
+        world={"WidthInCells": 4, "HeightInCells": 3}, sim_data=b"not a simsave"
+    )
+
+    width, height, cells = transformer._extract_grid(save_data)
+
+    assert (width, height) == (4, 3)
+    assert all(cell is cells[0][0] for row in cells for cell in row)
+    assert cells[0][0].element == "Vacuum"
+    assert cells[0][0].state == ElementState.GAS
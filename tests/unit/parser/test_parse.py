@@ -37,7 +37,9 @@ def test_read_bytes() -> None:
     """Should read multiple bytes."""
     data = b"HELLO WORLD"
     parser = BinaryParser(data)
-    assert parser.read_bytes(5) == b"HELLO"
+    value = parser.read_bytes(5)
+    assert value == b"HELLO"
+    assert isinstance(value, bytes)
     assert parser.offset == 5
 
 
@@ -169,3 +171,44 @@ def test_read_boolean() -> None:
     parser = BinaryParser(data)
     assert parser.read_boolean() is True
     assert parser.read_boolean() is False
+
+
+def test_read_array() -> None:
+    """Should read consecutive primitives in one call and bounds-check the block."""
+    data = struct.pack("<3i", 1, -2, 3) + struct.pack("<2f", 0.5, 1.5)
+    parser = BinaryParser(data)
+    assert parser.read_array("i", 3) == (1, -2, 3)
+    assert parser.offset == 12
+    assert parser.read_array("f", 2) == (0.5, 1.5)
+    assert parser.read_array("i", 0) == ()
+
+    parser = BinaryParser(data)
+    with pytest.raises(CorruptionError, match="need 24 bytes"):
+        parser.read_array("d", 3)
+    assert parser.offset == 0
+
+
+def test_read_struct() -> None:
+    """Should read several fields with one precompiled struct and bounds-check them."""
+    vector = struct.Struct("<3f")
+    parser = BinaryParser(vector.pack(1.0, -2.5, 3.0) + b"\x01")
+    assert parser.read_struct(vector) == (1.0, -2.5, 3.0)
+    assert parser.offset == 12
+    with pytest.raises(CorruptionError, match="need 12 bytes"):
+        parser.read_struct(vector)
+    assert parser.offset == 12
+
+
+def test_read_klei_string_reuses_repeated_strings() -> None:
+    """Repeated strings should decode to the same object, for bytes and bytearray input."""
+    encoded = b"StateMachineController"
+    data = (struct.pack("<i", len(encoded)) + encoded) * 2
+
+    parser = BinaryParser(data)
+    first = parser.read_klei_string()
+    second = parser.read_klei_string()
+    assert first == "StateMachineController"
+    assert first is second
+
+    parser = BinaryParser(bytearray(data))
+    assert parser.read_klei_string() == parser.read_klei_string() == "StateMachineController"
@@ -127,3 +127,43 @@ def test_round_trip_klei_string_null() -> None:
     writer.write_klei_string(None)
     parser = BinaryParser(writer.data)
     assert parser.read_klei_string() is None
+
+
+def test_position_tracks_bytes_written() -> None:
+    """Position should count bytes written and data should be immutable bytes."""
+    writer = BinaryWriter()
+    assert writer.position == 0
+    writer.write_uint32(1)
+    writer.write_byte(2)
+    writer.write_klei_string("abc")
+    assert writer.position == 12
+    assert isinstance(writer.data, bytes)
+    assert len(writer.data) == writer.position
+
+
+def test_write_struct_round_trip() -> None:
+    """Should pack several fields with one struct, readable back with read_struct."""
+    quaternion = struct.Struct("<4f")
+    writer = BinaryWriter()
+    writer.write_struct(quaternion, 0.0, 0.5, -1.0, 1.0)
+    assert writer.data == struct.pack("<4f", 0.0, 0.5, -1.0, 1.0)
+    assert BinaryParser(writer.data).read_struct(quaternion) == (0.0, 0.5, -1.0, 1.0)
+
+
+def test_reserve_and_fill_length_prefix() -> None:
+    """Reserved prefixes should be back-patched with the length written after them."""
+    writer = BinaryWriter()
+    writer.write_byte(0xAA)
+    prefix = writer.reserve_length_prefix()
+    writer.write_uint32(7)
+    writer.write_bytes(b"xy")
+    writer.fill_length_prefix(prefix)
+    assert writer.data == b"\xaa" + struct.pack("<i", 6) + struct.pack("<I", 7) + b"xy"
+
+    writer = BinaryWriter()
+    prefix = writer.reserve_length_prefix()
+    writer.write_int32(3)  # Count, not included in the length
+    data_start = writer.position
+    writer.write_bytes(b"abc")
+    writer.fill_length_prefix(prefix, data_start)
+    assert writer.data == struct.pack("<ii", 3, 3) + b"abc"
@@ -58,6 +58,25 @@ def create_test_templates() -> list[TypeTemplate]:
     return [minion_template, health_template]
 
 
+def test_game_object_types_are_slotted() -> None:
+    """Game object instances should carry no per-instance __dict__."""
+    position = Vector3(x=1.0, y=2.0, z=3.0)
+    obj = GameObject(
+        position=position,
+        rotation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0),
+        scale=Vector3(x=1.0, y=1.0, z=1.0),
+        folder=0,
+        behaviors=[GameObjectBehavior("Health", None, None, b"")],
+    )
+    group = GameObjectGroup(prefab_name="Minion", objects=[obj])
+    for instance in (position, obj.rotation, obj, obj.behaviors[0], group):
+        assert not hasattr(instance, "__dict__")
+
+    # Instances stay mutable for save editing
+    position.x = 5.0
+    assert obj.position == Vector3(x=5.0, y=2.0, z=3.0)
+
+
 def test_parse_vector3() -> None:
     """Should parse Vector3."""
     writer = BinaryWriter()
@@ -402,6 +421,86 @@ def test_round_trip_game_object_group() -> None:
     assert len(parsed.objects) == len(original.objects)
 
 
+def test_lazy_game_object_group_round_trips_unchanged() -> None:
+    """Lazy prefabs should keep their group bytes verbatim and skip object parsing."""
+    templates = create_test_templates()
+    obj = GameObject(
+        position=Vector3(x=1.0, y=2.0, z=3.0),
+        rotation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0),
+        scale=Vector3(x=1.0, y=1.0, z=1.0),
+        folder=2,
+        behaviors=[],
+    )
+    writer = BinaryWriter()
+    unparse_game_object_group(writer, templates, GameObjectGroup("Tile", [obj, obj]))
+    writer.write_byte(0xEE)  # Trailing data must not be consumed
+
+    parser = BinaryParser(writer.data)
+    lazy = parse_game_object_group(parser, templates, lazy_prefabs={"Tile"})
+    assert lazy.prefab_name == "Tile"
+    assert lazy.objects == []
+    assert lazy.instance_count == 2
+    assert parser.read_byte() == 0xEE
+
+    rewritten = BinaryWriter()
+    unparse_game_object_group(rewritten, templates, lazy)
+    assert rewritten.data == writer.data[:-1]
+
+    # Other prefabs are still parsed
+    parser = BinaryParser(writer.data)
+    parsed = parse_game_object_group(parser, templates, lazy_prefabs={"Minion"})
+    assert parsed.raw_data is None
+    assert parsed.objects == [obj, obj]
+    assert parsed.instance_count == 2
+
+
+def test_lazy_game_object_group_rejects_added_objects() -> None:
+    """Objects added to a lazily loaded group must not be silently dropped on save."""
+    templates = create_test_templates()
+    obj = GameObject(
+        position=Vector3(x=1.0, y=2.0, z=3.0),
+        rotation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0),
+        scale=Vector3(x=1.0, y=1.0, z=1.0),
+        folder=0,
+        behaviors=[],
+    )
+    writer = BinaryWriter()
+    unparse_game_object_group(writer, templates, GameObjectGroup("Tile", [obj]))
+
+    lazy = parse_game_object_group(BinaryParser(writer.data), templates, lazy_prefabs={"Tile"})
+    lazy.objects.append(obj)
+    with pytest.raises(ValueError, match="Tile"):
+        unparse_game_object_group(BinaryWriter(), templates, lazy)
+
+
+def test_parse_game_objects_lazy_prefabs_exact_names() -> None:
+    """lazy_prefabs should match whole prefab names and reject a bare string."""
+    templates = create_test_templates()
+    writer = BinaryWriter()
+    unparse_game_objects(writer, templates, [GameObjectGroup("Tile", [])])
+
+    # A list works as well as a set; "Til" must not match "Tile"
+    groups = parse_game_objects(BinaryParser(writer.data), templates, lazy_prefabs=["Til"])
+    assert groups[0].raw_data is None
+    groups = parse_game_objects(BinaryParser(writer.data), templates, lazy_prefabs=["Tile"])
+    assert groups[0].raw_data is not None
+
+    with pytest.raises(TypeError):
+        parse_game_objects(BinaryParser(writer.data), templates, lazy_prefabs="Tile")
+
+
+def test_lazy_game_object_group_truncated() -> None:
+    """Lazy prefabs should still detect a group running past the end of data."""
+    writer = BinaryWriter()
+    writer.write_klei_string("Tile")
+    writer.write_int32(1)  # instance count
+    writer.write_int32(100)  # data length, but no data follows
+
+    parser = BinaryParser(writer.data)
+    with pytest.raises(CorruptionError):
+        parse_game_object_group(parser, create_test_templates(), lazy_prefabs={"Tile"})
+
+
 def test_parse_game_objects() -> None:
     """Should parse game objects (top level)."""
     templates = create_test_templates()
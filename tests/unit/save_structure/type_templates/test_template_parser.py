@@ -26,6 +26,13 @@ def test_validate_dotnet_identifier_name_valid() -> None:
     assert validate_dotnet_identifier_name("prop123") == "prop123"
 
 
+def test_validate_dotnet_identifier_name_interns() -> None:
+    """Equal names from separate decodes should come back as one shared object."""
+    first = validate_dotnet_identifier_name(b"MinionIdentity".decode())
+    second = validate_dotnet_identifier_name(bytearray(b"MinionIdentity").decode())
+    assert first is second
+
+
 def test_validate_dotnet_identifier_name_null() -> None:
     """Should reject null/empty names."""
     with pytest.raises(CorruptionError, match="must not be null or zero length"):
@@ -284,3 +284,19 @@ def test_round_trip_through_file(tmp_path: Path) -> None:
     loaded_counts = get_prefab_counts(loaded)
     original_counts = get_prefab_counts(original)
     assert loaded_counts == original_counts
+
+
+def test_load_save_file_lazy_prefabs(tmp_path: Path) -> None:
+    """Lazily loaded prefabs should keep their counts and save back unchanged."""
+    original = create_test_save_game()
+    save_path = tmp_path / "lazy.sav"
+    save_to_file(original, save_path)
+    prefab = original.game_objects[0].prefab_name
+
+    loaded = load_save_file(save_path, lazy_prefabs={prefab})
+
+    assert get_game_objects_by_prefab(loaded, prefab) == []
+    assert get_prefab_counts(loaded) == get_prefab_counts(original)
+    resaved_path = tmp_path / "lazy_resaved.sav"
+    save_to_file(loaded, resaved_path)
+    assert resaved_path.read_bytes() == save_path.read_bytes()
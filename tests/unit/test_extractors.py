@@ -6,12 +6,16 @@ import pytest
 
 from oni_save_parser import get_game_objects_by_prefab, load_save_file
 from oni_save_parser.extractors import (
+    _GEYSER_STAT_KEYS,
+    _geyser_stats_row,
     extract_attribute_levels,
     extract_duplicant_skills,
     extract_duplicant_traits,
     extract_geyser_stats,
+    extract_geyser_stats_batch,
     extract_health_status,
     get_geyser_config_from_prefab,
+    parse_mastery_list,
 )
 
 
@@ -36,6 +40,21 @@ def test_extract_duplicant_skills_returns_dict() -> None:
     assert result["mastery_by_skill"]["Mining"] == 7
 
 
+def test_parse_mastery_list_keeps_highest_level() -> None:
+    """Test mastery list reduction to highest mastered level per skill."""
+    mastery = [
+        ("Mining1", True),
+        ("Mining3", True),
+        ("Mining2", True),
+        ("Building1", True),
+        ("Building2", False),
+        ("Cooking", True),
+        "malformed",
+    ]
+
+    assert parse_mastery_list(mastery) == {"Mining": 3, "Building": 1}
+
+
 def test_extract_duplicant_traits_returns_list() -> None:
     """Test that extract_duplicant_traits returns trait names."""
 
@@ -86,6 +105,23 @@ def test_extract_health_status_returns_dict() -> None:
     assert result["can_be_incapacitated"] is True
 
 
+def test_extract_health_status_maps_state_enum() -> None:
+    """Test that all Health.State enum values map to names."""
+
+    class MockBehavior:
+        def __init__(self, state: object) -> None:
+            self.template_data = {"State": state}
+
+    assert extract_health_status(MockBehavior(1))["state"] == "Incapacitated"
+    assert extract_health_status(MockBehavior(2))["state"] == "Dead"
+    assert extract_health_status(MockBehavior(3))["state"] == "Unknown"
+    assert extract_health_status(MockBehavior(-1))["state"] == "Unknown"
+    # Non-int states must not raise
+    assert extract_health_status(MockBehavior(1.0))["state"] == "Incapacitated"
+    assert extract_health_status(MockBehavior(None))["state"] == "Unknown"
+    assert extract_health_status(MockBehavior("x"))["state"] == "Unknown"
+
+
 def test_extract_attribute_levels_returns_dict() -> None:
     """Test that extract_attribute_levels extracts health/stress values."""
 
@@ -116,6 +152,50 @@ def test_extract_attribute_levels_returns_dict() -> None:
     assert result["Stress"]["current"] == 12.0
 
 
+def test_extract_attribute_levels_dict_format() -> None:
+    """Test max experience is derived from level for dict-format attributes."""
+
+    class MockBehavior:
+        def __init__(self) -> None:
+            self.name = "Klei.AI.AttributeLevels"
+            self.template_data = {
+                "saveLoadLevels": [
+                    {"attributeId": "Strength", "level": 3, "experience": 42.0},
+                    {"attributeId": "Digging", "level": 100, "experience": 7.0},
+                    {"attributeId": "Athletics", "level": -1, "experience": 0.0},
+                    {"attributeId": "Cooking", "level": 2.0, "experience": 5.0},
+                ]
+            }
+
+    result = extract_attribute_levels(MockBehavior())
+
+    assert result["Strength"] == {"current": 42.0, "max": 400.0}
+    assert result["Digging"] == {"current": 7.0, "max": 10100.0}
+    assert result["Athletics"] == {"current": 0.0, "max": 100.0}
+    assert result["Cooking"] == {"current": 5.0, "max": 300.0}
+
+
+def test_extractors_with_empty_template_data() -> None:
+    """Test extractors return defaults for behaviors without template data."""
+
+    class MockBehavior:
+        def __init__(self) -> None:
+            self.template_data: dict[str, object] = {}
+
+    skills = extract_duplicant_skills(MockBehavior())
+    assert skills == {"mastery_by_skill": {}, "aptitude_by_group": {}, "current_role": "None"}
+    assert extract_duplicant_traits(MockBehavior()) == []
+    assert extract_health_status(MockBehavior()) == {
+        "state": "Alive",
+        "can_be_incapacitated": True,
+    }
+    assert extract_attribute_levels(MockBehavior()) == {}
+
+    # Results must not be shared between calls
+    skills["mastery_by_skill"]["Mining"] = 1
+    assert extract_duplicant_skills(MockBehavior())["mastery_by_skill"] == {}
+
+
 def test_extractors_with_real_save() -> None:
     """Test extractors with actual save file data."""
     save_path = Path("test_saves/01-early-game-cycle-010.sav")
@@ -191,6 +271,89 @@ def test_extract_geyser_stats_with_thermal() -> None:
     assert "peak_thermal_power_kdtu_s" in stats
     assert stats["peak_thermal_power_kdtu_s"] > 0
 
+    # All three thermal values share the same kDTU-per-kg factor
+    kdtu_per_kg = 4.179 * temperature / 1000
+    assert abs(stats["peak_thermal_power_kdtu_s"] - 5.4 * kdtu_per_kg) < 1e-9
+    lifetime_kg_s = stats["average_output_lifetime_kg_s"]
+    assert abs(stats["average_thermal_power_kdtu_s"] - lifetime_kg_s * kdtu_per_kg) < 1e-9
+    assert abs(stats["thermal_per_eruption_kdtu"] - stats["kg_per_eruption"] * kdtu_per_kg) < 1e-9
+
+
+def test_geyser_stats_key_order_matches_row() -> None:
+    """Test extract_geyser_stats, the key table and the batch row kernel agree."""
+    config = {
+        "scaledRate": 5400.0,
+        "scaledIterationLength": 401.1,
+        "scaledIterationPercent": 0.582,
+        "scaledYearLength": 81800.0,
+        "scaledYearPercent": 0.720,
+    }
+    element = {"specific_heat_capacity": 4.179}
+
+    stats = extract_geyser_stats(config, element, 410.0)
+    row = _geyser_stats_row(config, element, 410.0)
+
+    assert tuple(stats) == _GEYSER_STAT_KEYS
+    assert stats == dict(zip(_GEYSER_STAT_KEYS, row, strict=True))
+
+
+def test_extract_geyser_stats_missing_keys_default_to_zero() -> None:
+    """Test geyser stats fall back to zero for missing configuration keys."""
+    stats = extract_geyser_stats({"scaledRate": 2000.0, "scaledIterationPercent": 0.5})
+
+    assert stats["emission_rate_kg_s"] == 2.0
+    assert stats["average_output_active_kg_s"] == 1.0
+    assert stats["eruption_cycle_s"] == 0.0
+    assert stats["average_output_lifetime_kg_s"] == 0.0
+
+
+def test_extract_geyser_stats_batch_matches_scalar() -> None:
+    """Test batch geyser stats match per-geyser extraction column by column."""
+    configs = [
+        {
+            "scaledRate": 5400.0,
+            "scaledIterationLength": 401.1,
+            "scaledIterationPercent": 0.582,
+            "scaledYearLength": 81800.0,
+            "scaledYearPercent": 0.720,
+        },
+        {
+            "scaledRate": 2693.44,
+            "scaledIterationLength": 353.0,
+            "scaledIterationPercent": 0.659,
+            "scaledYearLength": 77100.0,
+            "scaledYearPercent": 0.526,
+        },
+        {},
+    ]
+
+    batch = extract_geyser_stats_batch(configs)
+
+    for i, config in enumerate(configs):
+        stats = extract_geyser_stats(config)
+        assert set(batch) == set(stats)
+        for key, value in stats.items():
+            assert batch[key][i] == value, key
+
+
+def test_extract_geyser_stats_batch_thermal_columns() -> None:
+    """Test batch thermal columns, with None where thermal data is missing."""
+    config = {
+        "scaledRate": 5400.0,
+        "scaledIterationLength": 401.1,
+        "scaledIterationPercent": 0.582,
+        "scaledYearLength": 81800.0,
+        "scaledYearPercent": 0.720,
+    }
+    steam = {"specific_heat_capacity": 4.179}
+
+    batch = extract_geyser_stats_batch([config, config], [steam, None], [410.0, 410.0])
+
+    expected = extract_geyser_stats(config, steam, 410.0)
+    assert batch["peak_thermal_power_kdtu_s"] == [expected["peak_thermal_power_kdtu_s"], None]
+    assert batch["thermal_per_eruption_kdtu"][0] == expected["thermal_per_eruption_kdtu"]
+    assert extract_geyser_stats_batch([])["emission_rate_kg_s"] == []
+
 
 def test_get_geyser_config_from_prefab_known() -> None:
     """Test getting geyser config for known prefabs."""
@@ -213,6 +376,17 @@ def test_get_geyser_config_from_prefab_unknown() -> None:
     assert element_id is None
     assert temp_k is None
 
+    assert get_geyser_config_from_prefab("GeyserGeneric_unknown") == (None, None)
+    assert get_geyser_config_from_prefab("Minion") == (None, None)
+
+
+def test_get_geyser_config_from_prefab_covers_all_config() -> None:
+    """Test every GEYSER_CONFIG prefab passes the lookup's prefix filter."""
+    from oni_save_parser.extractors import GEYSER_CONFIG
+
+    for prefab, config in GEYSER_CONFIG.items():
+        assert get_geyser_config_from_prefab(prefab) == config, prefab
+
 
 def test_geyser_config_element_ids_valid() -> None:
     """Verify all element IDs in GEYSER_CONFIG exist in element loader."""
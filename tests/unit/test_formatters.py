@@ -1,12 +1,17 @@
 """Tests for output formatting functions."""
 
+import io
+
 from oni_save_parser.formatters import (
     format_duplicant_compact,
+    format_duplicants_compact,
     format_duration,
     format_geyser_compact,
+    format_geyser_compact_batch,
     format_geyser_detailed,
     format_mass,
     format_rate,
+    write_geyser_detailed,
 )
 
 
@@ -58,6 +63,41 @@ def test_format_duplicant_trait_formatting() -> None:
     assert "Early Bird" in result  # EarlyBird → Early Bird
 
 
+def test_format_duplicant_trait_keeps_acronyms() -> None:
+    """Test camelCase splitting only breaks at lower-to-upper boundaries."""
+    result = format_duplicant_compact({"traits": ["NightOwl", "SuperHVAC", "Yokel"]})
+    assert "Traits: Night Owl, Super HVAC, Yokel" in result
+
+
+def test_format_duplicant_compact_stress_percent() -> None:
+    """Test stress percentage is exact and tolerates a zero max."""
+    duplicant_data = {
+        "name": "Nails",
+        "health": {"current": 100.0, "max": 100.0},
+        "stress": {"current": 29.0, "max": 100.0},
+    }
+    assert "Stress: 29%" in format_duplicant_compact(duplicant_data)
+
+    duplicant_data["stress"] = {"current": 40.0, "max": 0.0}
+    assert "Stress: 40%" in format_duplicant_compact(duplicant_data)
+
+
+def test_format_duplicants_compact_matches_single() -> None:
+    """Test batch duplicant formatting matches per-duplicant formatting."""
+    duplicants = [
+        {"name": "Ashkan", "traits": ["QuickLearner", "CantDig", "GrantSkill_Mining2"]},
+        {"name": "Nails", "traits": ["EarlyBird", "QuickLearner"]},
+        {"name": "Bubbles"},
+        {"name": "Meep", "traits": []},
+    ]
+
+    result = format_duplicants_compact(duplicants)
+
+    assert result == [format_duplicant_compact(d) for d in duplicants]
+    assert "Traits: Early Bird, Quick Learner" in result[1]
+    assert format_duplicants_compact([]) == []
+
+
 def test_format_geyser_compact() -> None:
     """Test compact geyser format with kg/s (large value)."""
     stats = {
@@ -108,6 +148,40 @@ def test_format_geyser_compact_small_rate() -> None:
     assert result == expected
 
 
+def test_format_geyser_compact_batch_matches_single() -> None:
+    """Test batch compact geyser formatting matches per-geyser formatting."""
+    rows = [
+        (
+            "Cool Steam Vent",
+            0,
+            (127.5, 147.0),
+            "Steam",
+            136.9,
+            {
+                "average_output_lifetime_kg_s": 2.1,
+                "eruption_uptime_percent": 58.2,
+                "active_uptime_percent": 72.0,
+            },
+        ),
+        (
+            "Methane Vent",
+            1,
+            (165.5, 135.0),
+            "Methane",
+            150.0,
+            {
+                "average_output_lifetime_kg_s": 0.085,
+                "eruption_uptime_percent": 48.0,
+                "active_uptime_percent": 60.0,
+            },
+        ),
+    ]
+
+    expected = "\n".join(format_geyser_compact(*row) for row in rows)
+    assert format_geyser_compact_batch(rows) == expected
+    assert format_geyser_compact_batch([]) == ""
+
+
 def test_format_duration_short() -> None:
     """Test duration formatting for short periods (< 1 cycle)."""
     result = format_duration(233.4)
@@ -130,6 +204,29 @@ def test_format_mass_tons() -> None:
     assert format_mass(48100.0) == "48.1 t"
 
 
+def test_format_duration_and_mass_unit_boundary() -> None:
+    """Test values just below a unit boundary keep the smaller unit."""
+    assert format_duration(599.99) == "600.0s (1.0 cycles)"
+    assert format_duration(600.0) == "1.0 cycles (600.0s)"
+    assert format_mass(999.95) == "1000.0 kg"
+    assert format_mass(1000.0) == "1.0 t"
+
+
+def test_format_duration_and_mass_round_once() -> None:
+    """Test half-tenth values round exactly as the plain f-string would."""
+    assert format_duration(182.35) == "182.3s (0.3 cycles)"
+    assert format_duration(0.05) == "0.1s (0.0 cycles)"
+    assert format_mass(670.45) == "670.5 kg"
+
+
+def test_format_duration_and_mass_non_finite() -> None:
+    """Test infinite and NaN values format instead of raising."""
+    assert format_mass(float("inf")) == "inf t"
+    assert format_mass(float("nan")) == "nan kg"
+    assert format_duration(float("inf")) == "inf cycles (infs)"
+    assert format_duration(float("nan")) == "nan cycles (nans)"
+
+
 def test_format_rate_small_gs() -> None:
     """Test rate formatting in g/s for small values."""
     assert format_rate(0.085) == "85.0 g/s"
@@ -183,3 +280,70 @@ def test_format_geyser_detailed_header() -> None:
     assert "Steam (Gas)" in result
     assert "Output Temp:" in result
     assert "136.9°C" in result
+
+
+def test_format_geyser_detailed_reservoir_counts() -> None:
+    """Test reservoir counts round up and are not padded to a minimum."""
+    stats = {
+        "average_output_lifetime_kg_s": 2.1,
+        "average_output_active_kg_s": 2.9,
+        "emission_rate_kg_s": 5.4,
+        "eruption_uptime_percent": 58.2,
+        "active_uptime_percent": 72.0,
+        "overall_uptime_percent": 41.9,
+        "eruption_duration_s": 233.4,
+        "idle_duration_s": 167.7,
+        "eruption_cycle_s": 401.1,
+        "active_duration_s": 58896.1,
+        "dormant_duration_s": 22903.9,
+        "dormancy_cycle_s": 81800.0,
+        "kg_per_eruption": 1260.0,
+        "kg_per_active_period": 170800.0,
+        "storage_for_idle_kg": 0.0,
+        "storage_for_dormancy_kg": 2000.5,
+        "recommended_storage_kg": 2000.5,
+    }
+
+    gas = format_geyser_detailed("Vent", 0, (1.0, 2.0), "Steam", "Gas", 110.0, stats)
+    assert "- 0 Gas Reservoirs (1,000 kg each)" in gas
+    assert "- 3 Gas Reservoirs (1,000 kg each)" in gas
+
+    stats["storage_for_dormancy_kg"] = 5000.0
+    liquid = format_geyser_detailed(
+        "Geyser", 0, (1.0, 2.0), "Water", "Liquid", 95.0, stats, element_max_mass=1000.0
+    )
+    assert "- 1 Liquid Reservoir (5,000 kg each)" in liquid
+    assert "- 5 tiles @ 1,000 kg/tile max" in liquid
+
+
+def test_write_geyser_detailed_matches_format() -> None:
+    """Test writing to a stream produces the same text as formatting."""
+    stats = {
+        "average_output_lifetime_kg_s": 2.1,
+        "average_output_active_kg_s": 2.9,
+        "emission_rate_kg_s": 5.4,
+        "eruption_uptime_percent": 58.2,
+        "active_uptime_percent": 72.0,
+        "overall_uptime_percent": 41.9,
+        "eruption_duration_s": 233.4,
+        "idle_duration_s": 167.7,
+        "eruption_cycle_s": 401.1,
+        "active_duration_s": 58896.1,
+        "dormant_duration_s": 22903.9,
+        "dormancy_cycle_s": 81800.0,
+        "kg_per_eruption": 1260.0,
+        "kg_per_active_period": 170800.0,
+        "storage_for_idle_kg": 700.0,
+        "storage_for_dormancy_kg": 2000.5,
+        "recommended_storage_kg": 2000.5,
+    }
+    thermal_stats = {
+        "peak_thermal_power_kdtu_s": 12.5,
+        "average_thermal_power_kdtu_s": 5.2,
+        "thermal_per_eruption_kdtu": 2917.5,
+    }
+    args = ("Vent", 0, (1.0, 2.0), "Steam", "Gas", 110.0, stats, thermal_stats)
+
+    out = io.StringIO()
+    write_geyser_detailed(out, *args)
+    assert out.getvalue() == format_geyser_detailed(*args)